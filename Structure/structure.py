@@ -11,17 +11,48 @@ Usage:
 Dependencies:
 - Install the 'colorama' package: pip install colorama
 - Install the 'hurry.filesize' package: pip install hurry.filesize
+- Optionally install the 'orjson' package for faster JSON output: pip install orjson
 
 """
 
 import os
+import re
+import sys
+import codecs
+import shutil
+import fnmatch
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
+from functools import lru_cache
 from hurry.filesize import size
-from colorama import init, Fore  
+from colorama import init, Fore, Style
 import json
 
+try:
+    import orjson
+except ImportError:  # optional, to_json falls back to the json module
+    orjson = None
+
 init(autoreset=True)  
 
+# folders that are skipped entirely unless the caller passes its own exclude_dirs
+DEFAULT_EXCLUDE_DIRS = frozenset({".git", "node_modules", "__pycache__", "venv", ".venv", "dist", "build"})
+_GLOB_CHARS = re.compile(r"[*?[]")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_size(size_in_bytes):
+    """human readable size, cached because many files share the same byte count"""
+    return size(size_in_bytes)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_mtime(modified):
+    """local time string for an epoch mtime, cached because checkouts share timestamps"""
+    return datetime.fromtimestamp(modified).strftime("%Y-%m-%d %H:%M:%S")
+
+
 class ProjectStructure:
 
     """
@@ -29,77 +60,155 @@ class ProjectStructure:
 
         Attributes:
         - base_path (str): The base path of the project directory.
-        - include_file_types (list): List of file types to include in the analysis (optional).
-        - exclude_file_types (list): List of file types to exclude from the analysis (optional).
+        - include_file_types (list or set): File types to include in the analysis (optional).
+        - exclude_file_types (list or set): File types to exclude from the analysis (optional).
+        - exclude_dirs (set): Folder names or glob patterns whose subtrees are not visited at all.
+        - max_workers (int): Number of threads scanning folders in parallel (defaults to twice the CPU count);
+          1 scans serially from an explicit stack on the calling thread.
         - structure (dict): The hierarchical structure of the project.
+        - total_size (int): The total size of the project in bytes, filled in by read_project_structure.
         - show_file_content (bool): Flag to indicate whether to display file content.
 
         Methods:
         - _is_valid_file(file_name): Check if a file is valid based on included and excluded file types.
-        - _build_structure(current_path, node): Recursively build the project structure.
-        - _calculate_folder_size(node): Calculate the total size of a folder in bytes.
-        - _calculate_total_size(): Calculate the total size of the entire project.
+        - _is_excluded_dir(dir_name): Check if a folder matches one of the excluded folder names or patterns.
+        - _build_structure(current_path, node): Build the project structure in parallel and return its size in bytes.
+        - _scan_directory(current_path, node): Scan a single folder and return its file bytes and subfolders.
         - _draw_file_content(file_name, indent): Read and return the content of a file.
+        - _stream_file_content(file_path, indent): Write the content of a file to stdout in chunks.
         - read_project_structure(): Build and store the project structure.
-        - draw_project_structure(node=None, indent=0): Display the project structure.
+        - _ind(color, indent): Return the cached colored indent prefix for a depth.
+        - draw_project_structure(node=None, indent=0): Display the project structure with a single write.
         - create_project_summary_json(output_file="project_summary.json"): Generate a JSON summary of the project.
+        - to_json(path=None): Serialize the project structure to JSON bytes, using orjson when installed.
         - filter_files_by_size(min_size=0, max_size=float('inf')): Filter files based on size.
         - display_file_count(): Display the count of files and folders.
         - search_file(file_name): Search for a specific file in the project.
         - view_file_content(file_name): Display the content of a specific file.
 
         """
-    def __init__(self, base_path, include_file_types=None, exclude_file_types=None):
+    _indents = {}  # (color, indent) -> prefix, shared by every instance
+
+    def __init__(self, base_path, include_file_types=None, exclude_file_types=None,
+                 exclude_dirs=DEFAULT_EXCLUDE_DIRS, max_workers=None):
         self.base_path = base_path
+        self.max_workers = max_workers or (os.cpu_count() or 1) * 2
         self.include_file_types = include_file_types
         self.exclude_file_types = exclude_file_types
+        self.exclude_dirs = frozenset(exclude_dirs or ())
+        # plain names are a set lookup, glob patterns are folded into one regex
+        dir_globs = [d for d in self.exclude_dirs if _GLOB_CHARS.search(d)]
+        self._exclude_dir_names = self.exclude_dirs.difference(dir_globs)
+        self._exclude_dir_regex = re.compile("|".join(map(fnmatch.translate, dir_globs))) if dir_globs else None
+        # normalized once so each file costs a couple of set lookups instead of
+        # an endswith() call per configured extension
+        self._include = frozenset(ext.lower() for ext in include_file_types) if include_file_types else None
+        self._exclude = frozenset(ext.lower() for ext in exclude_file_types) if exclude_file_types else None
         self.structure = {}
+        self.total_size = 0
         self.show_file_content = False  
 
     def _is_valid_file(self, file_name):
         """
         checking the validity of the file basing on its extension
         """
-        if self.include_file_types and not any(file_name.lower().endswith(ext) for ext in self.include_file_types):
+        suffixes = self._file_suffixes(file_name)
+        if self._include and self._include.isdisjoint(suffixes):
             return False
-        if self.exclude_file_types and any(file_name.lower().endswith(ext) for ext in self.exclude_file_types):
+        if self._exclude and not self._exclude.isdisjoint(suffixes):
             return False
         return True
 
-    def _build_structure(self, current_path, node):
-        """building the system structure"""
-        for entry in os.listdir(current_path):
-            entry_path = os.path.join(current_path, entry)
-            if os.path.isdir(entry_path):
-                node[entry] = {"type": "folder", "size": None, "modified": None, "content": {}}
-                self._build_structure(entry_path, node[entry]["content"])
-            elif os.path.isfile(entry_path) and self._is_valid_file(entry):
-                size_in_bytes = os.path.getsize(entry_path)
-                modified_time = datetime.fromtimestamp(os.path.getmtime(entry_path))
-                node[entry] = {
-                    "type": "file",
-                    "size": size(size_in_bytes),
-                    "modified": modified_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "content": None
-                }
-                if self.show_file_content:
-                    node[entry]["content"] = self._draw_file_content(entry, 0)
+    def _is_excluded_dir(self, dir_name):
+        """
+        checking whether a folder should be pruned from the traversal
+        """
+        if dir_name in self._exclude_dir_names:
+            return True
+        return self._exclude_dir_regex is not None and self._exclude_dir_regex.match(dir_name) is not None
 
-    def _calculate_folder_size(self, node):
-        total_size = 0
-        for name, info in node.items():
-            if info["type"] == "folder":
-                total_size += self._calculate_folder_size(info["content"])
-            elif info["type"] == "file":
-                file_path = os.path.join(self.base_path, name)
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
-                else:
-                    pass
-        return total_size
+    @staticmethod
+    def _file_suffixes(file_name):
+        """
+        every dotted suffix of the lowercased file name, e.g. 'a.tar.gz' -> ['.tar.gz', '.gz'],
+        so multi-part extensions and dotfiles such as '.env' still match
+        """
+        name = file_name.lower()
+        suffixes = []
+        start = name.find(".")
+        while start != -1:
+            suffixes.append(name[start:])
+            start = name.find(".", start + 1)
+        return suffixes
 
-    def _calculate_total_size(self):
-        return self._calculate_folder_size(self.structure)
+    def _build_structure(self, current_path, node):
+        """
+        building the system structure, returning the total size of the subtree in bytes
+
+        every folder is scanned as its own task on a thread pool (or popped off a stack when
+        max_workers is 1); a task only writes into the node of the folder it scans, so many
+        scandir calls can be in flight at once
+        """
+        scanned = []  # (folder_info, own_bytes, subfolder_infos) in discovery order
+        if self.max_workers == 1:
+            # nothing to overlap, so walk an explicit stack on this thread instead:
+            # no pool overhead and no recursion limit on deep trees
+            stack = deque([(current_path, node, None)])
+            while stack:
+                path, folder_node, folder_info = stack.pop()
+                own_bytes, subfolders = self._scan_directory(path, folder_node)
+                scanned.append((folder_info, own_bytes, [info for _, info in subfolders]))
+                stack.extend((path, info["content"], info) for path, info in subfolders)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                pending = {pool.submit(self._scan_directory, current_path, node): None}
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        folder_info = pending.pop(future)
+                        own_bytes, subfolders = future.result()
+                        scanned.append((folder_info, own_bytes, [info for _, info in subfolders]))
+                        for path, info in subfolders:
+                            pending[pool.submit(self._scan_directory, path, info["content"])] = info
+
+        # a folder is always scanned after its parent, so walking the scan order
+        # backwards sums every subtree before the folder that contains it
+        folder_totals = {}
+        for folder_info, own_bytes, subfolder_infos in reversed(scanned):
+            folder_total = own_bytes + sum(folder_totals[id(info)] for info in subfolder_infos)
+            if folder_info is None:
+                return folder_total
+            folder_info["size"] = _fmt_size(folder_total)
+            folder_totals[id(folder_info)] = folder_total
+
+    def _scan_directory(self, current_path, node):
+        """
+        filling node with the files of a single folder, returning the bytes of those files
+        and the (path, info) pairs of the subfolders that still have to be scanned
+        """
+        own_bytes = 0
+        subfolders = []
+        # scandir hands back the entry type from the directory listing itself, so
+        # each entry costs at most one stat call instead of four or five
+        with os.scandir(current_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if self._is_excluded_dir(entry.name):
+                        continue
+                    node[entry.name] = {"type": "folder", "size": None, "modified": None, "content": {}}
+                    subfolders.append((entry.path, node[entry.name]))
+                elif entry.is_file(follow_symlinks=False) and self._is_valid_file(entry.name):
+                    st = entry.stat()
+                    own_bytes += st.st_size
+                    node[entry.name] = {
+                        "type": "file",
+                        "size": _fmt_size(st.st_size),
+                        "modified": st.st_mtime,  # epoch seconds, formatted only when drawn
+                        "content": None
+                    }
+                    if self.show_file_content:
+                        node[entry.name]["content"] = self._draw_file_content(entry.name, 0)
+        return own_bytes, subfolders
 
     def _draw_file_content(self, file_name, indent):
         file_path = os.path.join(self.base_path, file_name)
@@ -111,38 +220,96 @@ class ProjectStructure:
             return f"{Fore.RED}Error reading content of {file_name}: {str(e)}"
 
     def read_project_structure(self):
-        self._build_structure(self.base_path, self.structure)
+        self.total_size = self._build_structure(self.base_path, self.structure)
+
+    @classmethod
+    def _ind(cls, color, indent):
+        """colored indent prefix, rendered once per (color, depth) and reused afterwards"""
+        key = (color, indent)
+        prefix = cls._indents.get(key)
+        if prefix is None:
+            prefix = cls._indents[key] = f"{color}  " * indent
+        return prefix
+
+    def _stream_file_content(self, file_path, indent):
+        """
+        writing the content of a file straight to stdout in fixed size chunks,
+        so large files are never held in memory or decoded and re-encoded;
+        streams without a binary buffer (notebooks, Colab) get each chunk decoded
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                if not os.fstat(file.fileno()).st_size:
+                    return
+                sys.stdout.write(f"{self._ind(Fore.CYAN, indent)}{Fore.CYAN}Content:{Style.RESET_ALL}\n")
+                sys.stdout.flush()
+                buffer = getattr(sys.stdout, "buffer", None)
+                if buffer is not None:
+                    shutil.copyfileobj(file, buffer, length=65536)
+                    buffer.flush()
+                else:
+                    # incremental, so a character split across two chunks still decodes
+                    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+                    for chunk in iter(lambda: file.read(65536), b""):
+                        sys.stdout.write(decoder.decode(chunk))
+                    sys.stdout.write(decoder.decode(b"", final=True))
+                sys.stdout.write("\n")
+        except Exception as e:
+            sys.stdout.write(f"{Fore.RED}Error reading content of {file_path}: {str(e)}{Style.RESET_ALL}\n")
 
-    def draw_project_structure(self, node=None, indent=0):
+    def draw_project_structure(self, node=None, indent=0, _buf=None, _dir=None):
         if node is None:
             node = self.structure
+        if _dir is None:
+            _dir = self.base_path
+        # lines are collected and written in one go instead of one print per line;
+        # every line ends with a reset since colorama's autoreset only fires per write
+        lines = [] if _buf is None else _buf
+        reset = Style.RESET_ALL
+        blue_pad = self._ind(Fore.BLUE, indent)
+        green_pad = self._ind(Fore.GREEN, indent)
+        cyan_pad = self._ind(Fore.CYAN, indent + 1)
 
         for name, info in node.items():
             if info["type"] == "folder":
-                print(f"{Fore.BLUE}  " * indent + f"- {name} (Folder)")
+                lines.append(f"{blue_pad}- {name} (Folder){reset}")
                 if info["size"] is not None:
-                    print(f"{Fore.CYAN}  " * (indent + 1) + f"{Fore.CYAN}Size: {info['size']}")
+                    lines.append(f"{cyan_pad}{Fore.CYAN}Size: {info['size']}{reset}")
                 if info["modified"] is not None:
-                    print(f"{Fore.CYAN}  " * (indent + 1) + f"{Fore.CYAN}Last Modified: {info['modified']}")
-                self.draw_project_structure(info["content"], indent + 1)
+                    lines.append(f"{cyan_pad}{Fore.CYAN}Last Modified: {_fmt_mtime(info['modified'])}{reset}")
+                self.draw_project_structure(info["content"], indent + 1, lines, os.path.join(_dir, name))
             elif info["type"] == "file":
-                print(f"{Fore.GREEN}  " * indent + f"- {name} (File)")
-                print(f"{Fore.CYAN}  " * (indent + 1) + f"{Fore.CYAN}Size: {info['size']}")
-                print(f"{Fore.CYAN}  " * (indent + 1) + f"{Fore.CYAN}Last Modified: {info['modified']}")
+                lines.append(f"{green_pad}- {name} (File){reset}")
+                lines.append(f"{cyan_pad}{Fore.CYAN}Size: {info['size']}{reset}")
+                lines.append(f"{cyan_pad}{Fore.CYAN}Last Modified: {_fmt_mtime(info['modified'])}{reset}")
                 if self.show_file_content:
-                    content = self._draw_file_content(name, indent + 1)
-                    if content:
-                        print(f"{Fore.CYAN}  " * (indent + 1) + f"{Fore.CYAN}Content:")
-                        print(content)
+                    # flush what has been collected so far, then stream the file after it
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    lines.clear()
+                    self._stream_file_content(os.path.join(_dir, name), indent + 1)
 
         if indent == 0:
-            total_size = self._calculate_total_size()
-            print(f"\nTotal Project Size: {Fore.CYAN}{size(total_size)}")
+            lines.append(f"\nTotal Project Size: {Fore.CYAN}{_fmt_size(self.total_size)}{reset}")
+        if _buf is None and lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def create_project_summary_json(self, output_file="system_summary.json"):
         with open(output_file, "w") as json_file:
             json.dump(self.structure, json_file, indent=4)
 
+    def to_json(self, path=None):
+        """
+        serializing the structure to indented JSON bytes, written to path when one is given
+        """
+        if orjson is not None:
+            data = orjson.dumps(self.structure, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.structure, indent=2).encode("utf-8")
+        if path is not None:
+            with open(path, "wb") as json_file:
+                json_file.write(data)
+        return data
+
     def _filter_files_by_size(self, node, filtered_files, min_size, max_size):
         for name, info in node.items():
             if info["type"] == "folder":
@@ -224,41 +391,27 @@ if __name__ == "__main__":
     instabuildhub_path = r"/content/instabuild"
     project_structure = ProjectStructure(
         base_path=instabuildhub_path,
-        include_file_types=[
-            ".py", ".yaml", ".txt", ".cff", ".json", ".sh", ".env", ".template", ".dockerignore", ".toml",
-            ".h264", ".mkv", ".flv", ".wmv", ".3gp",  ".flac", ".aac", ".wma",".bmp", ".tiff", ".ico",                  
-            ".psd", ".ai", ".eps",".indd", ".cdr", ".svg",".avi", ".mpeg", ".mpg", ".mov",".ogg", ".webm",                          
-            ".rpm", ".deb",".bat", ".cmd", ".sh", ".bash", ".ico", ".cur",                           
-            ".webp", ".jp2", ".jxr", ".bpg",          
-            ".ac3", ".mka",".blend", ".obj", ".fbx", ".stl", ".pdb", ".obj", ".pyc", ".pyd",".bak", ".old", ".swp", ".swo",           
-            ".ps1", ".psm1", ".psd1",".html", ".htm", ".php",                 
-            ".css", ".scss", ".less",".js", ".jsx", ".ts", ".tsx", ".vue",".java", ".class", ".jar",                
-            ".py", ".pyc", ".pyd",".rb", ".rhtml", ".erb",".pl", ".pm",".cpp", ".c", ".h", 
-            ".hpp", ".swift", ".m", ".mm",".go", ".dart",".lua",                               
-            ".rust",".scala",".kotlin",".groovy", ".bat", ".cmd",".ps1", ".psm1",".json", ".yaml", ".yml",            
-            ".xml", ".json", ".yaml", ".yml",".sql", ".db", ".sqlite",".conf", ".config", ".ini",".ini",".md", ".markdown",                      
-            ".tex", ".bib",".pdf", ".doc", ".docx", ".ppt", ".pptx", ".csv",                                 
-            ".rtf",".txt",".log",".bak", ".swp", ".swo",".url", ".webloc", ".desktop",       
-            ".dll", ".lib", ".so", ".pdf", ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx", ".zip", ".rar", ".tar", ".gz",           
-            ".exe", ".msi", ".apk",".mp3", ".wav", ".ogg",".mp4", ".avi", ".mov", ".mkv",        
-            ".jpeg", ".jpg", ".png", ".gif", ".svg", ".eps", ".ai",                 
-            ".torrent", ".dwg", ".ppt", ".pptx",".key", ".accdb",".msg",".eml",".ics", ".apk",                                  
-            ".rpm",".dmg",".iso", ".ova",".vdi", ".bak", ".backup",".conf", ".config",".ics",                                  
-            ".idx", ".sub",".iso",".ova",".vdi",".bak", ".backup",                      
-            ".conf", ".config", ".dll", ".sys", ".idx", ".sub", ".bat", ".com", ".cmd",                 
-            ".eps", ".ps", ".gz", ".bz2", ".tar", ".xz",".dmg",".bin", ".cue",".arj", ".lzh", ".tar.gz", ".tar.bz2",   
-            ".xml", ".xsl", ".xsd",".url", ".webloc", ".desktop", ".bmp", ".gif", ".png", ".tiff", ".jpg", 
-            ".txt", ".ini", ".conf", ".log", ".wav", ".mp3", ".flac", ".aac",         
-            ".avi", ".mp4", ".mkv", ".mov",".ttf", ".otf", ".fon", ".csv", ".tsv",                          
-            ".json", ".yaml", ".yml",".pdf", ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx", ".md", ".markdown",".php", ".jsp", ".asp", ".aspx",".html", ".htm", ".css", ".js",          
-            ".py", ".java", ".cpp", ".c", ".swift",   ".dll", ".lib", ".so",".exe", ".msi", ".app",                 
-            ".pkg", ".deb", ".rpm", ".db", ".sqlite",".psd", ".ai", ".cdr",".wmv", ".mov", ".mkv", ".flv",         
-            ".ogg", ".mp3", ".wav", ".flac", ".jpeg", ".jpg", ".png", ".gif",         
-            ".ppt", ".pptx", ".key",".eml", ".msg",".log", ".txt",".tmp", ".temp", ".swp",".bak", ".old",                          
-            ".srt", ".sub",".rar", ".zip", ".7z", ".tar", ".gz",    ".bak", ".backup",".conf", ".config", ".ini",".ics",".dll", ".sys",                          
-            ".idx", ".sub",".m3u", ".pls",".bak",".swf",".ics", ".idx", ".sub",".in" 
-        ],
-        exclude_file_types=[".log"]
+        include_file_types=frozenset({
+            ".py", ".yaml", ".txt", ".cff", ".json", ".sh", ".env", ".template", ".dockerignore",
+            ".toml", ".h264", ".mkv", ".flv", ".wmv", ".3gp", ".flac", ".aac", ".wma", ".bmp",
+            ".tiff", ".ico", ".psd", ".ai", ".eps", ".indd", ".cdr", ".svg", ".avi", ".mpeg",
+            ".mpg", ".mov", ".ogg", ".webm", ".rpm", ".deb", ".bat", ".cmd", ".bash", ".cur",
+            ".webp", ".jp2", ".jxr", ".bpg", ".ac3", ".mka", ".blend", ".obj", ".fbx", ".stl",
+            ".pdb", ".pyc", ".pyd", ".bak", ".old", ".swp", ".swo", ".ps1", ".psm1", ".psd1",
+            ".html", ".htm", ".php", ".css", ".scss", ".less", ".js", ".jsx", ".ts", ".tsx", ".vue",
+            ".java", ".class", ".jar", ".rb", ".rhtml", ".erb", ".pl", ".pm", ".cpp", ".c", ".h",
+            ".hpp", ".swift", ".m", ".mm", ".go", ".dart", ".lua", ".rust", ".scala", ".kotlin",
+            ".groovy", ".yml", ".xml", ".sql", ".db", ".sqlite", ".conf", ".config", ".ini", ".md",
+            ".markdown", ".tex", ".bib", ".pdf", ".doc", ".docx", ".ppt", ".pptx", ".csv", ".rtf",
+            ".log", ".url", ".webloc", ".desktop", ".dll", ".lib", ".so", ".xls", ".xlsx", ".zip",
+            ".rar", ".tar", ".gz", ".exe", ".msi", ".apk", ".mp3", ".wav", ".mp4", ".jpeg", ".jpg",
+            ".png", ".gif", ".torrent", ".dwg", ".key", ".accdb", ".msg", ".eml", ".ics", ".dmg",
+            ".iso", ".ova", ".vdi", ".backup", ".idx", ".sub", ".sys", ".com", ".ps", ".bz2", ".xz",
+            ".bin", ".cue", ".arj", ".lzh", ".tar.gz", ".tar.bz2", ".xsl", ".xsd", ".ttf", ".otf",
+            ".fon", ".tsv", ".jsp", ".asp", ".aspx", ".app", ".pkg", ".tmp", ".temp", ".srt", ".7z",
+            ".m3u", ".pls", ".swf", ".in"
+        }),
+        exclude_file_types=frozenset({".log"})
     )
     project_structure.read_project_structure()
     project_structure.draw_project_structure()
@@ -22,7 +22,7 @@ class CodeInjector:
 
         Parameters:
             - target_file: The path to the target file.
-            - code_to_inject: The code to be injected into the file.
+            - code_to_inject: The code to be injected into the file (str, or already UTF-8 encoded bytes).
             - user: The user attempting to inject the code.
             - backup: Whether to create a backup before injection. Default is True.
 
@@ -45,9 +45,13 @@ class CodeInjector:
             if backup:
                 backup_path = self._create_backup(target_file)
 
-            # Inject code into the target file as specified
-            with open(target_file, "a") as file:
-                file.write("\n" + code_to_inject)
+            # Inject code into the target file as specified, writing the separator and the
+            # payload separately so a large snippet is not copied just to prepend a newline
+            if isinstance(code_to_inject, str):
+                code_to_inject = code_to_inject.encode("utf-8")
+            with open(target_file, "ab") as file:
+                file.write(b"\n")
+                file.write(code_to_inject)
 
             # Log the code injection event
             self.logger.log_injection_event(user, target_file, backup_path)
@@ -72,9 +76,98 @@ class CodeInjector:
         try:
             timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
             backup_path = f"{target_file}.{timestamp}.bak"
-            shutil.copy2(target_file, backup_path)
+
+            # Backups keep the mtime of the file they were taken from, so if the newest
+            # backup matches the current mtime and size the file has not changed since
+            # and a hard link to that backup is enough
+            st = os.stat(target_file)
+            latest_backup = self._find_latest_backup(target_file)
+            if latest_backup is not None:
+                latest_path, latest_st = latest_backup
+                if latest_st.st_mtime_ns == st.st_mtime_ns and latest_st.st_size == st.st_size:
+                    if latest_path == backup_path:
+                        return backup_path
+                    try:
+                        os.link(latest_path, backup_path)
+                        return backup_path
+                    except OSError:
+                        # Hard links not supported here; fall back to a real copy
+                        pass
+
+            # Copy under a private name and rename over backup_path: an existing backup
+            # there may be a hard link shared with an older one, and opening it for
+            # writing would truncate both
+            temp_path = f"{backup_path}.{os.getpid()}.tmp"
+            try:
+                with open(target_file, "rb") as source, open(temp_path, "wb") as backup_file:
+                    st = os.fstat(source.fileno())
+                    self._copy_file_contents(source, backup_file, st.st_size)
+                # Keep the original timestamps on the backup, as copy2 did
+                os.utime(temp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+                os.replace(temp_path, backup_path)
+            except BaseException:
+                try:
+                    os.unlink(temp_path)
+                except FileNotFoundError:
+                    pass
+                raise
             return backup_path
         except Exception as e:
             # Log any exceptions during the backup creation process
             self.logger.log_error(f"Backup creation failed: {str(e)}")
             return ""
+
+    @staticmethod
+    def _find_latest_backup(target_file):
+        """
+        Find the most recent backup of the target file.
+
+        Parameters:
+            - target_file: The path to the target file.
+
+        Returns:
+            - Tuple: (path: str, stat: os.stat_result) of the newest backup by mtime, or None.
+        """
+        directory, file_name = os.path.split(os.path.abspath(target_file))
+        prefix = f"{file_name}."
+        latest = None
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(".bak")):
+                    continue
+                if not name[len(prefix):-len(".bak")].isdigit() or not entry.is_file(follow_symlinks=False):
+                    continue
+                entry_stat = entry.stat()
+                if latest is None or entry_stat.st_mtime_ns > latest[1].st_mtime_ns:
+                    latest = (os.path.join(os.path.dirname(target_file), name), entry_stat)
+        return latest
+
+    @staticmethod
+    def _copy_file_contents(source, destination, file_size):
+        """
+        Copy the contents of one open binary file to another.
+
+        Uses os.sendfile where the platform supports it so the data never leaves the
+        kernel, and falls back to shutil.copyfileobj with a 1 MiB buffer otherwise.
+
+        Parameters:
+            - source: The open source file.
+            - destination: The open destination file.
+            - file_size: The number of bytes to copy.
+        """
+        if hasattr(os, "sendfile"):
+            try:
+                offset = 0
+                while offset < file_size:
+                    sent = os.sendfile(destination.fileno(), source.fileno(), offset, file_size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # e.g. filesystems that do not support sendfile; restart with a plain copy
+                source.seek(0)
+                destination.seek(0)
+                destination.truncate()
+        shutil.copyfileobj(source, destination, 1 << 20)
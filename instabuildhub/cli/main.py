@@ -25,31 +25,35 @@ When using Azure services, specify the Azure endpoint for the OpenAI service.
 
 import logging
 import os
+import shutil
 from pathlib import Path
-# changing the openai importation
-import openai
 
 import typer
-from dotenv import load_dotenv
 
 from instabuildhub.data.file_repository import FileRepository, FileRepositories, archive
 from instabuildhub.core.ai import AI
 from instabuildhub.core.steps import STEPS, Config as StepsConfig
 from instabuildhub.cli.collect import collect_learnings
 from instabuildhub.cli.learning import check_collection_consent
-from instabuildhub.data.code_vector_repository import CodeVectorRepository
 
 app = typer.Typer()  # creates a CLI app
 
 
 def load_env_if_needed():
-    if os.getenv("GOOGLE_API_KEY") is None:
+    # imported here so that e.g. `--help` does not pay for loading them
+    import openai
+    from dotenv import load_dotenv
+
+    api_key = os.environ.get("GOOGLE_API_KEY")
+    if api_key is None:
         load_dotenv()
-    if os.getenv("GOOGLE_API_KEY") is None:
+        api_key = os.environ.get("GOOGLE_API_KEY")
+    if api_key is None:
         # if there is no .env file, try to load from the current working directory
         load_dotenv(dotenv_path=os.path.join(os.getcwd(), ".env"))
+        api_key = os.environ.get("GOOGLE_API_KEY")
         # needs modification-----> api
-    openai.api_key = os.getenv("GOOGLE_API_KEY")
+    openai.api_key = api_key
 
 
 def load_prompt(dbs: FileRepositories):
@@ -68,12 +72,16 @@ def preprompts_path(use_custom_preprompts: bool, input_path: Path = None) -> Pat
         return original_preprompts_path
 
     custom_preprompts_path = input_path / "preprompts"
-    if not custom_preprompts_path.exists():
-        custom_preprompts_path.mkdir()
-
-    for file in original_preprompts_path.glob("*"):
-        if not (custom_preprompts_path / file.name).exists():
-            (custom_preprompts_path / file.name).write_text(file.read_text())
+    custom_preprompts_path.mkdir(exist_ok=True)
+
+    # one listing of the destination instead of an exists() check per preprompt,
+    # and a plain byte copy instead of decoding and re-encoding each file
+    with os.scandir(custom_preprompts_path) as entries:
+        existing = {entry.name for entry in entries}
+    with os.scandir(original_preprompts_path) as entries:
+        for entry in entries:
+            if entry.name not in existing:
+                shutil.copyfile(entry.path, custom_preprompts_path / entry.name)
     return custom_preprompts_path
 
 
@@ -177,8 +185,6 @@ def main(
         project_metadata=FileRepository(project_metadata_path),
     )
 
-    codeVectorRepository = CodeVectorRepository()
-
     if steps_config not in [
         StepsConfig.EXECUTE_ONLY,
         StepsConfig.USE_FEEDBACK,
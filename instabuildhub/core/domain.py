@@ -12,12 +12,15 @@ Variables:
       is expected to return a list of dictionaries.
 """
 
-from typing import Callable, List, TypeVar
+from typing import TYPE_CHECKING, Callable, List, TypeVar
 
 from instabuildhub.core.ai import AI
 from instabuildhub.data.file_repository import FileRepositories
-from instabuildhub.data.code_vector_repository import CodeVectorRepository
+
+if TYPE_CHECKING:
+    # only needed for the annotation; importing it pulls in llama_index
+    from instabuildhub.data.code_vector_repository import CodeVectorRepository
 
 Step = TypeVar(
-    "Step", bound=Callable[[AI, FileRepositories, CodeVectorRepository], List[dict]]
+    "Step", bound=Callable[[AI, FileRepositories, "CodeVectorRepository"], List[dict]]
 )
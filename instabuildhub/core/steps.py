@@ -68,7 +68,6 @@ from instabuildhub.core.chat_to_files import (
 from instabuildhub.data.file_repository import FileRepositories
 from instabuildhub.cli.file_selector import FILE_LIST_NAME, ask_for_files
 from instabuildhub.cli.learning import human_review_input
-from instabuildhub.data.code_vector_repository import CodeVectorRepository
 
 MAX_SELF_HEAL_ATTEMPTS = 2  # constants for self healing code
 ASSUME_WORKING_TIMEOUT = 30
@@ -496,6 +495,9 @@ def set_improve_filelist(ai: AI, dbs: FileRepositories):
 
 
 def vector_improve(ai: AI, dbs: FileRepositories):
+    # llama_index is slow to import and only needed by this step
+    from instabuildhub.data.code_vector_repository import CodeVectorRepository
+
     code_vector_repository = CodeVectorRepository()
     code_vector_repository.load_from_directory(dbs.workspace.path)
     releventDocuments = code_vector_repository.relevent_code_chunks(dbs.input["prompt"])
@@ -21,6 +21,7 @@ Classes:
 
 Imports:
     - datetime: For timestamp generation when archiving.
+    - os: For scanning directories when listing files.
     - shutil: For moving directories during archiving.
     - dataclasses: For the DBs dataclass definition.
     - pathlib: For path manipulations.
@@ -28,12 +29,13 @@ Imports:
 """
 
 import datetime
+import os
 import shutil
 
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterator, Optional, Union
 from instabuildhub.data.supported_languages import SUPPORTED_LANGUAGES
 
 
@@ -172,9 +174,14 @@ class FileRepository:
         assert isinstance(val, str), "val must be str"
 
         full_path = self.path / key
-        full_path.parent.mkdir(parents=True, exist_ok=True)
 
-        full_path.write_text(val, encoding="utf-8")
+        # The parent folder almost always exists already, so only create it when
+        # the write fails for lack of it instead of calling mkdir on every write
+        try:
+            full_path.write_text(val, encoding="utf-8")
+        except FileNotFoundError:
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            full_path.write_text(val, encoding="utf-8")
 
     def __delitem__(self, key: Union[str, Path]) -> None:
         """
@@ -199,21 +206,36 @@ class FileRepository:
         elif item_path.is_dir():
             shutil.rmtree(item_path)
 
+    @staticmethod
+    def _iter_files(directory: Path) -> Iterator[Path]:
+        """
+        Yield every file below a directory, without following symlinked folders.
+
+        Walks with os.scandir so file/folder checks use the entry types cached from the
+        directory listing instead of a separate stat per path.
+        """
+        pending = [directory]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
+
     def _supported_files(self, directory: Path) -> str:
         valid_extensions = {
             ext for lang in SUPPORTED_LANGUAGES for ext in lang["extensions"]
         }
         file_paths = [
             str(item)
-            for item in sorted(directory.rglob("*"))
-            if item.is_file() and item.suffix in valid_extensions
+            for item in sorted(self._iter_files(directory))
+            if item.suffix in valid_extensions
         ]
         return "\n".join(file_paths)
 
     def _all_files(self, directory: Path) -> str:
-        file_paths = [
-            str(item) for item in sorted(directory.rglob("*")) if item.is_file()
-        ]
+        file_paths = [str(item) for item in sorted(self._iter_files(directory))]
         return "\n".join(file_paths)
 
     def to_path_list_string(self, supported_code_files_only: bool = False) -> str:
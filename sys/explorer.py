@@ -25,18 +25,75 @@ Key Features:
 
 import os
 import pathlib
+import re
 import shutil
-import chardet
+import sys
+import codecs
+import filecmp
+import functools
+import mmap
+import string
 import magic
 import hashlib
+import heapq
 import zipfile
 import tarfile
-from typing import List
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from operator import itemgetter
+from typing import Iterator, List, Tuple, Union
+
+try:
+    # cchardet (or its maintained fork faust-cchardet, same module name) is a C
+    # implementation with the same incremental detector API
+    from cchardet import UniversalDetector
+except ImportError:  # optional, fall back to the pure-Python chardet
+    from chardet.universaldetector import UniversalDetector
+
+# ASCII-only lowercase table for searching raw file bytes without decoding them
+_ASCII_LOWER = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+_SEARCH_WINDOW_SIZE = 1 << 20
+_BINARY_SNIFF_SIZE = 4096
+_MAGIC_HEADER_SIZE = 4096
+_WORD_RE = re.compile(rb"\S+")
+_SEPARATOR = "-" * 40 + "\n"
+_PREVIEW_CHUNK_SIZE = 4096
+_EXTRACT_BUFFER_SIZE = 1 << 20
+_ENCODING_SAMPLE_SIZE = 1 << 16
+_ENCODING_CHUNK_SIZE = 1 << 13
+# Below this chardet confidence a guess is no better than assuming UTF-8
+_ENCODING_MIN_CONFIDENCE = 0.5
+# UTF-32 marks first, since the UTF-32-LE mark starts with the UTF-16-LE one
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Keys of the file info dicts, all of which get_all_files can sort by
+_SORT_FIELDS = frozenset({"name", "path", "size", "type", "created", "modified"})
+
+def _default_workers() -> int:
+    """
+    Thread count for the I/O-bound directory scans.
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
 
 class Explorer:
     def __init__(self):
         # Initialize the file explorer with the current working directory
         self.current_directory = pathlib.Path(__file__).parent.resolve()
+        # Loading the libmagic database is expensive, so each thread builds one detector
+        # and reuses it (a libmagic cookie must not be shared between threads), and
+        # results are remembered per (path, mtime, size) so repeated sweeps skip libmagic
+        self._local = threading.local()
+        self._cached_file_type = functools.lru_cache(maxsize=4096)(self._detect_file_type)
+        self._cached_encoding = functools.lru_cache(maxsize=4096)(self._detect_encoding)
+        self._cached_digest = functools.lru_cache(maxsize=4096)(self._digest_file)
 
     def explore_directory(self):
         """
@@ -58,81 +115,220 @@ class Explorer:
         # print(f"items: {dir_info['items']}")
         print("-" * 40)
 
-    def get_all_files(self, sort_by: str = "name", file_type: str = None) -> List[dict]:
+    def iter_files(self, file_type: str = None, workers: int = 1, include_type: bool = True) -> Iterator[dict]:
+        """
+        Lazily yield detailed information about the files in the current directory.
+
+        With the default single worker, files are yielded in directory order as they are
+        scanned, so callers that only need a few of them can stop early. With more
+        workers the files are typed on a thread pool, still in directory order.
+        include_type=False leaves out the libmagic "type" unless a file_type filter needs it.
+        """
+        if file_type is not None and "/" not in file_type:
+            # A bare family such as "text" means the whole MIME family "text/"
+            file_type += "/"
+        entries = self._iter_file_entries()
+        describe = functools.partial(self.get_file_info_from_entry, include_type=include_type or file_type is not None)
+        if workers is None:
+            workers = _default_workers()
+        if workers == 1:
+            for file_info in map(describe, entries):
+                if file_type is None or file_info["type"].startswith(file_type):
+                    yield file_info
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for file_info in executor.map(describe, entries):
+                if file_type is None or file_info["type"].startswith(file_type):
+                    yield file_info
+
+    def _iter_file_entries(self) -> Iterator[os.DirEntry]:
         """
-        Retrieve detailed information about all files in the current directory.
+        Yield the directory entries of the files in the current directory.
+
+        Every file is typed by libmagic before a file_type filter is applied: an extension
+        cannot rule a file out, since libmagic types an empty ".txt" as "application/x-empty"
+        and may disagree with the name for any other file too.
         """
-        file_list = []
-        for file_path in self.current_directory.iterdir():
-            if file_path.is_file():
-                if file_type is None or self.get_file_type(file_path).startswith(file_type):
-                    file_info = self.get_file_info(file_path)
-                    file_list.append(file_info)
+        with os.scandir(self.current_directory) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry
 
-        # Sort files based on the specified criteria
-        file_list.sort(key=lambda x: x.get(sort_by, 0))
-        return file_list
+    def get_all_files(self, sort_by: str = "name", file_type: str = None, workers: int = None,
+                      include_type: bool = True) -> List[dict]:
+        """
+        Retrieve detailed information about all files in the current directory.
+        """
+        if sort_by not in _SORT_FIELDS:
+            raise ValueError(f"Cannot sort files by '{sort_by}'. Expected one of: {', '.join(sorted(_SORT_FIELDS))}.")
+        # Sort files based on the specified criteria; every file is needed before
+        # sorting anyway, so they are typed on a thread pool by default
+        include_type = include_type or sort_by == "type"
+        return sorted(self.iter_files(file_type, workers=workers, include_type=include_type), key=itemgetter(sort_by))
     
     def print_file_info(self, files_info: List[dict]):
         """
         Print information about files.
         """
-        for file_info in files_info:
-            print(f"Name: {file_info['name']}")
-            print(f"Path: {file_info['path']}")
-            print(f"Size: {file_info['size']} bytes")
-            print(f"Type: {file_info['type']}")
-            print(f"Created: {file_info['created']}")
-            print(f"Modified: {file_info['modified']}")
-            print("-" * 40)
+        # One write for the whole listing instead of seven prints per file
+        sys.stdout.write("".join(
+            f"Name: {file_info['name']}\n"
+            f"Path: {file_info['path']}\n"
+            f"Size: {file_info['size']} bytes\n"
+            f"Type: {file_info['type']}\n"
+            f"Created: {file_info['created']}\n"
+            f"Modified: {file_info['modified']}\n"
+            f"{_SEPARATOR}"
+            for file_info in files_info
+        ))
 
     def get_file_info(self, file_path: pathlib.Path) -> dict:
         """
         Retrieve detailed information about a specific file.
         """
+        stat = file_path.stat()
         file_info = {
             "name": file_path.name,
             "path": str(file_path),
-            "size": file_path.stat().st_size,  # File size in bytes
-            "type": self.get_file_type(file_path),
-            "created": file_path.stat().st_ctime,  # Creation time
-            "modified": file_path.stat().st_mtime,  # Last modification time
+            "size": stat.st_size,  # File size in bytes
+            "type": self.get_file_type(file_path, stat),
+            "created": stat.st_ctime,  # Creation time
+            "modified": stat.st_mtime,  # Last modification time
+        }
+        return file_info
+
+    def get_file_info_from_entry(self, entry: os.DirEntry, include_type: bool = True) -> dict:
+        """
+        Retrieve detailed information about a file from its directory entry.
+
+        Uses the stat result cached on the entry, so no extra stat calls are made per file.
+        The libmagic "type" is only looked up when include_type is set.
+        """
+        stat = entry.stat(follow_symlinks=False)
+        file_info = {
+            "name": entry.name,
+            "path": entry.path,
+            "size": stat.st_size,  # File size in bytes
+            "created": stat.st_ctime,  # Creation time
+            "modified": stat.st_mtime,  # Last modification time
         }
+        if include_type:
+            file_info["type"] = self.get_file_type(entry.path, stat)
         return file_info
 
-    def get_file_type(self, file_path: pathlib.Path) -> str:
+    def get_file_type(self, file_path: Union[str, pathlib.Path], stat: os.stat_result = None) -> str:
         """
         Determine the file type using the 'magic' library.
         """
-        mime = magic.Magic()
-        return mime.from_file(str(file_path))
+        if stat is None:
+            stat = os.stat(file_path)
+        return self._cached_file_type(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def _detect_file_type(self, file_path: str, mtime_ns: int, size: int) -> str:
+        """
+        Run libmagic on a file; mtime_ns and size only key the result cache.
+
+        Only the file header is read and sniffed, since that is where the type
+        signatures libmagic matches on live.
+        """
+        with open(file_path, 'rb') as file:
+            header = file.read(_MAGIC_HEADER_SIZE)
+        return self._thread_magic().from_buffer(header)
+
+    def _thread_magic(self) -> "magic.Magic":
+        """
+        Return the calling thread's libmagic detector, creating it on first use.
+        """
+        detector = getattr(self._local, "magic", None)
+        if detector is None:
+            detector = self._local.magic = magic.Magic(mime=True, mime_encoding=False)
+        return detector
+
+    def iter_search_files(self, keyword: str, workers: int = None) -> Iterator[dict]:
+        """
+        Lazily yield files containing a specific keyword in their content.
+
+        Files are searched on a thread pool of `workers` threads (1 searches serially in
+        directory order), and each match is yielded as soon as it is found.
+        """
+        keyword_bytes = keyword.lower().encode()
+        with os.scandir(self.current_directory) as entries:
+            files = [entry for entry in entries if entry.is_file(follow_symlinks=False)]
+        if workers is None:
+            workers = _default_workers()
+        if workers == 1:
+            for entry in files:
+                file_info = self._search_file(entry, keyword_bytes)
+                if file_info is not None:
+                    yield file_info
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._search_file, entry, keyword_bytes) for entry in files]
+            for future in as_completed(futures):
+                file_info = future.result()
+                if file_info is not None:
+                    yield file_info
+
+    def _search_file(self, entry: os.DirEntry, keyword_bytes: bytes) -> dict:
+        """
+        Return the file info of a file if it contains the keyword, otherwise None.
+        """
+        try:
+            if self._file_contains(entry.path, keyword_bytes):
+                return self.get_file_info_from_entry(entry)
+        except Exception as e:
+            print(f"Error reading {entry.path}: {str(e)}")
+        return None
+
+    @staticmethod
+    def _file_contains(file_path: str, keyword_bytes: bytes) -> bool:
+        """
+        Case-insensitively (ASCII) check whether a text file contains the given bytes.
 
-    def search_files(self, keyword: str) -> List[dict]:
+        The file is memory-mapped and scanned in 1 MiB windows, stopping at the first hit,
+        so it is never decoded or copied whole. Files with a NUL byte in their first 4 KiB
+        are treated as binary and skipped.
+        """
+        with open(file_path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return not keyword_bytes
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if b"\0" in mm[:_BINARY_SNIFF_SIZE]:
+                    return False
+                # Overlap the windows so a match straddling a boundary is still found
+                overlap = max(len(keyword_bytes) - 1, 0)
+                for start in range(0, size, _SEARCH_WINDOW_SIZE):
+                    window = mm[max(start - overlap, 0):start + _SEARCH_WINDOW_SIZE]
+                    if window.translate(_ASCII_LOWER).find(keyword_bytes) != -1:
+                        return True
+        return False
+
+    def search_files(self, keyword: str, workers: int = None) -> List[dict]:
         """
         Search for files containing a specific keyword in their content.
         """
-        matching_files = []
-        for file_path in self.current_directory.iterdir():
-            if file_path.is_file():
-                try:
-                    if keyword.lower() in file_path.read_text().lower():
-                        file_info = self.get_file_info(file_path)
-                        matching_files.append(file_info)
-                except Exception as e:
-                    print(f"Error reading {file_path}: {str(e)}")
-        return matching_files
+        return list(self.iter_search_files(keyword, workers=workers))
 
 
-    def get_file_type_statistics(self) -> dict:
+    def get_file_type_statistics(self, workers: int = None) -> dict:
         """
         Get statistics on the count of different file types in the directory.
-        """
-        file_type_statistics = {}
-        for file_path in self.current_directory.iterdir():
-            if file_path.is_file():
-                file_type = self.get_file_type(file_path)
-                file_type_statistics[file_type] = file_type_statistics.get(file_type, 0) + 1
-        return file_type_statistics
+
+        libmagic spends most of its time reading file headers with the GIL released, so the
+        files are typed on a thread pool of `workers` threads (1 types them serially).
+        """
+        with os.scandir(self.current_directory) as entries:
+            files = [(entry.path, entry.stat(follow_symlinks=False))
+                     for entry in entries if entry.is_file(follow_symlinks=False)]
+        if workers is None:
+            workers = _default_workers()
+        if workers == 1 or len(files) < 2:
+            file_types = (self.get_file_type(path, stat) for path, stat in files)
+            return dict(Counter(file_types))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            file_types = executor.map(self.get_file_type, *zip(*files))
+            return dict(Counter(file_types))
         # print('-' * 40)
 
     def preview_file_content(self, file_path: pathlib.Path, num_lines: int = 5):
@@ -152,12 +348,19 @@ class Explorer:
 
         # Open the file and display the content preview
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                print(f"Content preview of {file_path}:")
-                for _ in range(num_lines):
-                    line = file.readline().strip()
-                    print(line)
-                print("-" * 40)
+            # Read just enough of the head to cover num_lines lines and decode that once,
+            # instead of a decoding readline() call per line
+            head = b""
+            with open(file_path, 'rb') as file:
+                while head.count(b"\n") < num_lines:
+                    chunk = file.read(_PREVIEW_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    head += chunk
+            lines = [line.decode('utf-8', 'replace').strip() for line in head.splitlines()[:num_lines]]
+            # Past the end of the file the preview shows blank lines, as readline() did
+            lines += [""] * (num_lines - len(lines))
+            sys.stdout.write(f"Content preview of {file_path}:\n" + "".join(f"{line}\n" for line in lines) + _SEPARATOR)
         except Exception as e:
             print(f"Error reading {file_path}: {str(e)}")
             print("-" * 40)
@@ -167,31 +370,91 @@ class Explorer:
         Read and return the content of a file.
         """
         try:
-            with open(file_path, 'r', encoding=self.detect_encoding(file_path)) as file:
-                content = file.read() if num_lines is None else ''.join([next(file) for _ in range(num_lines)])
-            return content
+            encoding = self.detect_encoding(file_path)
+            try:
+                return self._read_text(file_path, encoding, num_lines)
+            except UnicodeDecodeError:
+                # The guess is made from the head of the file only; when the rest does not
+                # decode with it, settle the encoding over the whole file, as chardet once did
+                full_encoding = self._detect_encoding(str(file_path), 0, 0, sample_size=None)
+                if full_encoding == encoding:
+                    raise
+                return self._read_text(file_path, full_encoding, num_lines)
         except UnicodeDecodeError as e:
             return f"Error decoding {file_path}: {str(e)}"
         except Exception as e:
             return f"Error reading {file_path}: {str(e)}"
 
 
+    @staticmethod
+    def _read_text(file_path: pathlib.Path, encoding: str, num_lines: int = None) -> str:
+        with open(file_path, 'r', encoding=encoding) as file:
+            return file.read() if num_lines is None else ''.join(islice(file, num_lines))
+
     def detect_encoding(self, file_path: pathlib.Path) -> str:
         """
-        Detect the character encoding of a file using the 'chardet' library.
+        Detect the character encoding of a file using the 'cchardet' or 'chardet' library.
+        """
+        stat = os.stat(file_path)
+        return self._cached_encoding(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def _detect_encoding(self, file_path: str, mtime_ns: int, size: int,
+                         sample_size: int = _ENCODING_SAMPLE_SIZE) -> str:
+        """
+        Feed the head of a file to chardet; mtime_ns and size only key the result cache.
+
+        The detector is fed in small chunks and stops as soon as it is confident, and
+        never reads past sample_size bytes (the whole file if None), so large files are
+        not read in full. A head that is pure ASCII, or a sample chardet is unsure about,
+        is reported as UTF-8: it decodes the same, and so does any non-ASCII text past it.
         """
+        detector = UniversalDetector()
         with open(file_path, 'rb') as file:
-            result = chardet.detect(file.read())
-        return result['encoding']
+            chunk = file.read(_ENCODING_CHUNK_SIZE)
+            # A byte order mark settles the question without running chardet at all
+            for bom, encoding in _BOM_ENCODINGS:
+                if chunk.startswith(bom):
+                    return encoding
+            remaining = sample_size
+            while chunk:
+                detector.feed(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+                    if remaining <= 0:
+                        break
+                if detector.done:
+                    break
+                chunk = file.read(_ENCODING_CHUNK_SIZE if remaining is None else min(_ENCODING_CHUNK_SIZE, remaining))
+        detector.close()
+        encoding = detector.result['encoding']
+        if not encoding or encoding.lower() == 'ascii':
+            return 'utf-8'
+        # Over the whole file the guess stands however unsure, as chardet.detect's did
+        if sample_size is not None and (detector.result['confidence'] or 0) < _ENCODING_MIN_CONFIDENCE:
+            return 'utf-8'
+        return encoding
 
     def analyze_text_file(self, file_path: pathlib.Path):
         """
         Perform basic text analysis on the content of a text file.
         """
         if file_path.suffix.lower() == '.txt':
-            content = self.read_file_content(file_path)
-            word_count = len(content.split())
-            unique_words = len(set(content.split()))
+            # Tokenize the raw bytes of a read-only mapping in one regex pass; counting
+            # words does not need the text decoded, so chardet is not run either
+            word_count = 0
+            unique = set()
+            try:
+                with open(file_path, 'rb') as file:
+                    if os.fstat(file.fileno()).st_size:
+                        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            for match in _WORD_RE.finditer(mm):
+                                word_count += 1
+                                unique.add(match.group())
+            except Exception as e:
+                print(f"Error reading {file_path}: {str(e)}")
+                print("-" * 40)
+                return
+            unique_words = len(unique)
             print(f"Text analysis for {file_path}:")
             print(f"Total words: {word_count}")
             print(f"Unique words: {unique_words}")
@@ -203,9 +466,10 @@ class Explorer:
     def filter_files_by_type(self, file_type: str) -> List[dict]:
         """
         Filter files based on their types.
+
+        file_type is a MIME type prefix such as "text/x-python", or a family such as "text".
         """
-        filtered_files = [file_info for file_info in self.get_all_files() if file_info['type'].startswith(file_type)]
-        return filtered_files
+        return self.get_all_files(file_type=file_type)
     
     
     def rename_file(self, old_name: str, new_name: str):
@@ -229,18 +493,122 @@ class Explorer:
         """
         Download selected files to a specified destination.
         """
+        os.makedirs(destination, exist_ok=True)
         for file_name in files:
             source_path = self.current_directory / file_name
             destination_path = pathlib.Path(destination) / file_name
-            destination_path.write_bytes(source_path.read_bytes())
+            # copyfile uses the kernel's zero-copy paths (sendfile/copy_file_range) where
+            # available, so the file contents never pass through a Python buffer
+            shutil.copyfile(source_path, destination_path)
 
-    def extract_archive(self, archive_file: str, destination: str):
+    def extract_archive(self, archive_file: str, destination: str, workers: int = None):
         """
         Extract files from an archive to a specified destination.
+
+        Zip members are extracted on a thread pool of `workers` threads (1 extracts
+        serially), since zlib releases the GIL while inflating. Tar archives, optionally
+        compressed, are streamed in a single forward pass.
         """
         archive_path = self.current_directory / archive_file
+        if not zipfile.is_zipfile(archive_path) and tarfile.is_tarfile(archive_path):
+            self._extract_tar(archive_path, destination)
+            return
         with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-            zip_ref.extractall(destination)
+            members = zip_ref.infolist()
+            if workers is None:
+                workers = os.cpu_count() or 1
+            if workers == 1 or len(members) < 2:
+                for info in members:
+                    self._extract_zip_member(zip_ref, info, destination)
+                return
+
+        # A ZipFile must not be read from several threads at once, so every worker
+        # opens its own handle on the archive
+        local = threading.local()
+        handles = []
+
+        def extract_member(info: zipfile.ZipInfo):
+            zip_file = getattr(local, "zip_file", None)
+            if zip_file is None:
+                zip_file = local.zip_file = zipfile.ZipFile(archive_path, 'r')
+                handles.append(zip_file)
+            self._extract_zip_member(zip_file, info, destination)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(extract_member, members))
+        finally:
+            for zip_file in handles:
+                zip_file.close()
+
+    @staticmethod
+    def _extract_zip_member(zip_file: zipfile.ZipFile, info: zipfile.ZipInfo, destination: str):
+        """
+        Extract one zip member, copying it through a 1 MiB buffer.
+
+        The member name is sanitized the way ZipFile.extract does it: absolute paths,
+        drive letters, "." and ".." components are dropped so nothing lands outside
+        destination.
+        """
+        arcname = info.filename.replace('/', os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        parts = [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+        if not parts:
+            return
+        target_path = os.path.join(destination, *parts)
+        if info.is_dir():
+            os.makedirs(target_path, exist_ok=True)
+            return
+        # exist_ok also keeps concurrent workers from racing on a shared parent folder
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        with zip_file.open(info) as source, open(target_path, 'wb') as target:
+            shutil.copyfileobj(source, target, _EXTRACT_BUFFER_SIZE)
+
+    @staticmethod
+    def _extract_tar(archive_path: pathlib.Path, destination: str):
+        """
+        Extract a tar archive in streaming mode, without a seek-around index pass.
+        """
+        with tarfile.open(archive_path, 'r|*') as tar:
+            if hasattr(tarfile, "data_filter"):
+                # Refuse members that would escape destination or carry unsafe metadata
+                tar.extractall(destination, filter="data")
+            else:
+                tar.extractall(destination, members=Explorer._checked_tar_members(tar, destination))
+
+    @staticmethod
+    def _checked_tar_members(tar: tarfile.TarFile, destination: str):
+        """
+        Yield the members of tar, applying the checks of tarfile's "data" filter for
+        Pythons that lack it: leading slashes are dropped, and members that would land
+        outside destination, links pointing outside it and device or FIFO members raise
+        tarfile.TarError.
+        """
+        destination = os.path.realpath(destination)
+
+        def inside(path: str) -> bool:
+            return os.path.commonpath([destination, os.path.realpath(path)]) == destination
+
+        for member in tar:
+            member.name = member.name.lstrip('/' + os.sep)
+            target_path = os.path.join(destination, member.name)
+            if not inside(target_path):
+                raise tarfile.TarError(f"{member.name!r} would be extracted outside {destination!r}")
+            if member.ischr() or member.isblk() or member.isfifo():
+                raise tarfile.TarError(f"{member.name!r} is a special file")
+            if member.issym():
+                if os.path.isabs(member.linkname) or not inside(
+                        os.path.join(os.path.dirname(target_path), member.linkname)):
+                    raise tarfile.TarError(f"{member.name!r} links outside {destination!r}")
+            elif member.islnk():
+                member.linkname = member.linkname.lstrip('/' + os.sep)
+                if not inside(os.path.join(destination, member.linkname)):
+                    raise tarfile.TarError(f"{member.name!r} links outside {destination!r}")
+            # Never carry setuid, setgid or sticky bits over
+            member.mode &= 0o777
+            yield member
 
     def compare_files(self, file1: str, file2: str) -> bool:
         """
@@ -248,21 +616,78 @@ class Explorer:
         """
         file1_path = self.current_directory / file1
         file2_path = self.current_directory / file2
-        return file1_path.read_text() == file2_path.read_text()
+        # filecmp rejects on differing sizes without reading, then compares in chunks
+        # until the first difference; it also works on binary files
+        return filecmp.cmp(file1_path, file2_path, shallow=False)
+
+    def compare_many(self, pairs: List[Tuple[str, str]]) -> List[bool]:
+        """
+        Compare the content of many pairs of files.
+
+        Pairs of different sizes are rejected from their stat alone; the rest are compared
+        by digest, and each file's digest is computed once however many pairs it is in.
+        """
+        results = []
+        for file1, file2 in pairs:
+            stat1 = os.stat(self.current_directory / file1)
+            stat2 = os.stat(self.current_directory / file2)
+            results.append(
+                stat1.st_size == stat2.st_size and self.file_hash(file1, stat1) == self.file_hash(file2, stat2)
+            )
+        return results
+
+    def file_hash(self, file_name: str, stat: os.stat_result = None) -> bytes:
+        """
+        Return a 128-bit BLAKE2b digest of a file's content, e.g. to spot duplicates.
+        """
+        file_path = str(self.current_directory / file_name)
+        if stat is None:
+            stat = os.stat(file_path)
+        return self._cached_digest(file_path, stat.st_mtime_ns, stat.st_size)
+
+    def _digest_file(self, file_path: str, mtime_ns: int, size: int) -> bytes:
+        """
+        Hash a file; mtime_ns and size only key the result cache.
+
+        The file is memory-mapped and fed to the hash directly, so it is never
+        copied into a Python bytes object.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as file:
+            if size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest.update(mm)
+        return digest.digest()
 
     def recursive_directory_listing(self):
         """
         Perform a recursive listing of files and folders.
         """
-        for root, dirs, files in os.walk(self.current_directory):
-            print(f"Current Directory: {root}")
-            print("Files:")
-            for file_name in files:
-                print(f"  - {file_name}")
-            print("Folders:")
-            for dir_name in dirs:
-                print(f"  - {dir_name}")
-            print("-" * 40)
+        # os.scandir based depth-first walk: one listing per directory and the entry
+        # types reused from it, visiting directories in the same order os.walk does
+        pending = [str(self.current_directory)]
+        lines = []
+        while pending:
+            root = pending.pop()
+            dirs = []
+            files = []
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        (dirs if entry.is_dir() else files).append(entry)
+            except OSError:
+                continue
+            # like os.walk, symlinked folders are listed but not descended into
+            pending.extend(entry.path for entry in reversed(dirs) if not entry.is_symlink())
+            # Collect the whole listing and write it once, rather than one print
+            # (and, on a terminal, one flush) per line
+            lines.append(f"Current Directory: {root}\n")
+            lines.append("Files:\n")
+            lines.extend(f"  - {entry.name}\n" for entry in files)
+            lines.append("Folders:\n")
+            lines.extend(f"  - {entry.name}\n" for entry in dirs)
+            lines.append(_SEPARATOR)
+        sys.stdout.write("".join(lines))
 
     def create_file_type(self, file_name: str, content: str = None, file_type: str = 'txt'):
         """
@@ -377,12 +802,22 @@ class Explorer:
         """
         Display information about recent changes in the directory.
         """
-        changes = sorted(self.get_all_files(), key=lambda x: x['modified'], reverse=True)[:num_changes]
+        changes = heapq.nlargest(num_changes, self._iter_files_mtime(), key=itemgetter(1))
         print(f"Recent Changes:")
-        for change in changes:
-            print(f"  - {change['name']}: {change['modified']}")
+        for name, modified in changes:
+            print(f"  - {name}: {modified}")
         print("-" * 40)
 
+    def _iter_files_mtime(self) -> Iterator[Tuple[str, float]]:
+        """
+        Yield (name, modification time) for each file in the current directory.
+
+        A lightweight tuple per entry is all recent_changes_info needs, so no file info
+        dict is built and libmagic is not run.
+        """
+        for entry in self._iter_file_entries():
+            yield entry.name, entry.stat(follow_symlinks=False).st_mtime
+
     def user_preferences(self, sort_by: str = "name", display_detail: bool = True):
         """
         Set and display user-specific preferences for directory information.
@@ -1,5 +1,8 @@
 import os
 import ast
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import List
 from bandit.core import perform_security_analysis
 from radon.complexity import analyze_code_complexity
@@ -20,6 +23,21 @@ from git import integrate_with_git
 from doxypypy import improve_documentation_quality
 from pycodestyle import follow_community_best_practices
 
+SKIPPED_DIRECTORIES = frozenset({'.git', '__pycache__', 'venv', '.venv', 'node_modules', 'build', 'dist'})
+
+@lru_cache(maxsize=256)
+def _parse_file(file_path, mtime_ns, size):
+    """
+    Parse a Python file once; mtime_ns and size only key the cache, so re-running the
+    analyses over unchanged files reuses the tree instead of re-reading and re-parsing.
+
+    The source is handed to ast.parse as bytes, which honours any coding declaration
+    without a separate decode pass.
+    """
+    with open(file_path, 'rb') as file:
+        source = file.read()
+    return ast.parse(source, filename=file_path)
+
 class AdditionalFeaturesModule:
     def __init__(self, target_directory):
         self.target_directory = os.path.abspath(target_directory)
@@ -43,54 +61,73 @@ class AdditionalFeaturesModule:
             'DocumentationQualityImprovement': [],
             'CommunityBestPractices': []
         }
+        # Messages for the file being analyzed, written out in one go once it is done
+        self._output = []
 
-    def analyze_code(self):
+    def analyze_code(self, workers=None):
         python_files = self._get_python_files()
-
-        for file_path in python_files:
-            try:
-                self._analyze_file(file_path)
-            except Exception as e:
-                print(f"Error while analyzing {file_path}: {e}")
-
+        # cpu_percent() reports usage since its previous call, so prime it here and read
+        # it once the whole run is done instead of sampling meaningless per-file deltas
+        psutil.cpu_percent(interval=None)
+
+        if workers == 1:
+            for file_path in python_files:
+                try:
+                    self._analyze_file(file_path)
+                except Exception as e:
+                    print(f"Error while analyzing {file_path}: {e}")
+        else:
+            # The analyses are CPU-bound Python, so files are spread over processes
+            # rather than threads; each worker parses and analyzes its files locally
+            # and sends back the categories they were reported under
+            analyze = partial(_analyze_file_worker, self.target_directory)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for file_path, categories, error in executor.map(analyze, python_files, chunksize=4):
+                    for category, files in categories.items():
+                        self.error_categories[category].extend(files)
+                    if error is not None:
+                        print(f"Error while analyzing {file_path}: {error}")
+
+        self._report_performance()
         self._print_analysis_summary()
 
     def _analyze_file(self, file_path):
-        with open(file_path, 'r', encoding='utf-8') as file:
-            original_code = file.read()
-
-        parsed_code = ast.parse(original_code)
-
-        self._perform_security_analysis(parsed_code, file_path)
-        self._analyze_code_complexity(parsed_code, file_path)
-        self._generate_code_documentation(parsed_code, file_path)
-        self._integrate_with_testing_framework(parsed_code, file_path)
-        self._analyze_performance(parsed_code, file_path)
-        self._migrate_code(parsed_code, file_path)
-        self._analyze_usability(parsed_code, file_path)
-        self._localize_code(parsed_code, file_path)
-        self._collect_code_metrics(parsed_code, file_path)
-        self._scan_for_vulnerabilities(parsed_code, file_path)
-        self._integrate_with_collaboration_tools(parsed_code, file_path)
-        self._incorporate_user_feedback(parsed_code, file_path)
-        self._integrate_with_ci_cd(parsed_code, file_path)
-        self._check_licensing_compliance(parsed_code, file_path)
-        self._enhance_code_understanding(parsed_code, file_path)
-        self._integrate_with_git(parsed_code, file_path)
-        self._improve_documentation_quality(parsed_code, file_path)
-        self._follow_community_best_practices(parsed_code, file_path)
+        stat = os.stat(file_path)
+        parsed_code = _parse_file(file_path, stat.st_mtime_ns, stat.st_size)
+
+        try:
+            self._perform_security_analysis(parsed_code, file_path)
+            self._analyze_code_complexity(parsed_code, file_path)
+            self._generate_code_documentation(parsed_code, file_path)
+            self._integrate_with_testing_framework(parsed_code, file_path)
+            self._migrate_code(parsed_code, file_path)
+            self._analyze_usability(parsed_code, file_path)
+            self._localize_code(parsed_code, file_path)
+            self._collect_code_metrics(parsed_code, file_path)
+            self._scan_for_vulnerabilities(parsed_code, file_path)
+            self._integrate_with_collaboration_tools(parsed_code, file_path)
+            self._incorporate_user_feedback(parsed_code, file_path)
+            self._integrate_with_ci_cd(parsed_code, file_path)
+            self._check_licensing_compliance(parsed_code, file_path)
+            self._enhance_code_understanding(parsed_code, file_path)
+            self._integrate_with_git(parsed_code, file_path)
+            self._improve_documentation_quality(parsed_code, file_path)
+            self._follow_community_best_practices(parsed_code, file_path)
+        finally:
+            sys.stdout.write("".join(self._output))
+            self._output.clear()
 
     def _perform_security_analysis(self, parsed_code, file_path):
         security_issues = perform_security_analysis(parsed_code)
         if security_issues:
             self.error_categories['SecurityAnalysis'].append(file_path)
-            print(f"Security issues detected in {file_path}: {security_issues}")
+            self._output.append(f"Security issues detected in {file_path}: {security_issues}\n")
 
     def _analyze_code_complexity(self, parsed_code, file_path):
         complexity_issues = analyze_code_complexity(parsed_code)
         if complexity_issues:
             self.error_categories['ComplexityAnalysis'].append(file_path)
-            print(f"Code complexity issues detected in {file_path}: {complexity_issues}")
+            self._output.append(f"Code complexity issues detected in {file_path}: {complexity_issues}\n")
 
     def _generate_code_documentation(self, parsed_code, file_path):
         generate_code_documentation(parsed_code)
@@ -100,17 +137,17 @@ class AdditionalFeaturesModule:
         testing_issues = integrate_with_testing_framework(parsed_code)
         # Placeholder for printing success or issues
 
-    def _analyze_performance(self, parsed_code, file_path):
-        cpu_usage = psutil.cpu_percent()
+    def _report_performance(self):
+        cpu_usage = psutil.cpu_percent(interval=None)
         memory_usage = psutil.virtual_memory().percent
-        print(f"Performance analysis for {file_path}: CPU Usage: {cpu_usage}%, Memory Usage: {memory_usage}%")
+        print(f"Performance analysis for {self.target_directory}: CPU Usage: {cpu_usage}%, Memory Usage: {memory_usage}%")
 
     def _migrate_code(self, parsed_code, file_path):
         # Example: Move the file to a backup directory
         backup_directory = os.path.join(os.path.dirname(file_path), "backup")
         os.makedirs(backup_directory, exist_ok=True)
         shutil.move(file_path, os.path.join(backup_directory, os.path.basename(file_path)))
-        print(f"Code migrated for {file_path}")
+        self._output.append(f"Code migrated for {file_path}\n")
 
     def _analyze_usability(self, parsed_code, file_path):
         analyze_usability(parsed_code)
@@ -161,16 +198,45 @@ class AdditionalFeaturesModule:
         # Placeholder for printing success or issues
 
     def _get_python_files(self) -> List[str]:
-        # Implementation to retrieve Python files in the target directory
-        # ...
-        pass
+        # Walk the target directory with os.scandir, reusing each entry's cached type
+        # instead of a stat per path, and never descend into VCS, virtualenv or build
+        # folders, which hold most of the entries in a typical checkout
+        python_files = []
+        pending = [self.target_directory]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIPPED_DIRECTORIES:
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file():
+                        python_files.append(entry.path)
+        return python_files
 
     def _print_analysis_summary(self):
-        print("Summary of Additional Analysis:")
+        lines = ["Summary of Additional Analysis:\n"]
         for category, files in self.error_categories.items():
-            print(f"{category}: {len(files)} files")
-            for file_path in files:
-                print(f"- {file_path}")
+            lines.append(f"{category}: {len(files)} files\n")
+            lines.extend(f"- {file_path}\n" for file_path in files)
+        sys.stdout.write("".join(lines))
+
+def _analyze_file_worker(target_directory, file_path):
+    """
+    Analyze one file in a worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor. Returns the file path,
+    the non-empty error categories it was reported under, and a description of the error
+    (if any) that stopped its analysis; the error travels as text, since not every
+    exception can be pickled.
+    """
+    module = AdditionalFeaturesModule(target_directory)
+    error = None
+    try:
+        module._analyze_file(file_path)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    categories = {category: files for category, files in module.error_categories.items() if files}
+    return file_path, categories, error
 
 # Example usage:
 if __name__ == "__main__":
@@ -1,54 +1,303 @@
 import os
 import ast
-import autopep8
+import sys
+import json
+import hashlib
+import psutil
 import shutil
-from difflib import unified_diff
-from importlib.util import find_spec
-import bandit  # Example library for security analysis
-import radon  # Example library for code complexity analysis
-import sphinx  # Example library for documentation generation
-import pytest  # Example library for testing integration
-import concurrent.futures  # Example library for concurrency/parallelism analysis
-import safety  # Example library for dependency analysis
-import flake8  # Example library for code style consistency
-import pylint  # Example library for error handling improvement
-import clonedigger  # Example library for code duplication detection
-import git  # Example library for code evolution patterns analysis
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from enum import IntEnum
+from importlib import import_module, metadata
+
+# The analysis libraries below are imported through _lazy by the branches that use them:
+# radon (code complexity), safety (dependency analysis), clonedigger (code duplication
+# detection), git (code evolution patterns)
+
+@lru_cache(maxsize=None)
+def _lazy(name):
+    """
+    Import an analysis library on first use, so a run with its checks disabled neither
+    pays for the import nor needs the library installed.
+    """
+    return import_module(name)
+
+_DEF_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+# Nodes that can hold a def in their body; match_case only exists from Python 3.10
+_DEF_CONTAINERS = (ast.stmt, ast.excepthandler, getattr(ast, 'match_case', ()))
+
+def _walk_defs(tree):
+    """
+    Yield every class and function definition in a tree, in no particular order.
+
+    An explicit stack instead of ast.walk's generator machinery, and it only descends into
+    statement-level nodes, since a def can never sit inside an expression.
+    """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _DEF_NODES):
+            yield node
+        stack.extend(child for child in ast.iter_child_nodes(node) if isinstance(child, _DEF_CONTAINERS))
+
+def _read_source(path):
+    """
+    Read a source file's bytes with one open, one fstat and a single read sized from it.
+
+    That is about half the system calls of open().read(), which also seeks and re-stats
+    the file; on network filesystems each one is a round trip.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        size = os.fstat(fd).st_size
+        source = os.read(fd, size + 1)
+        if len(source) > size:
+            # The file grew after fstat; pick up the rest
+            chunks = [source]
+            chunk = os.read(fd, 1 << 16)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, 1 << 16)
+            source = b"".join(chunks)
+    finally:
+        os.close(fd)
+    return source
+
+def _interned(pairs):
+    """
+    json object_pairs_hook that interns keys and string values. Paths, issue codes and
+    messages repeat across thousands of records, so each distinct string is kept once.
+    """
+    return {sys.intern(key): sys.intern(value) if isinstance(value, str) else value for key, value in pairs}
+
+# Bytes of file paths per tool command line: Windows caps a whole command line at 32 KiB,
+# and Linux caps the argument list (with the environment) at ARG_MAX, often 2 MiB
+_ARGV_LIMIT = 24 << 10 if os.name == 'nt' else 1 << 17
+
+@lru_cache(maxsize=None)
+def _tool_version(distribution):
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+# Config files each linter reads from the folder it runs in, which is the target directory;
+# pylint also honours $PYLINTRC and a user-level pylintrc, added by _tool_options
+_TOOL_CONFIG_FILES = {
+    'bandit': ('bandit.yaml',),
+    'flake8': ('setup.cfg', 'tox.ini', '.flake8'),
+    'pylint': ('pylintrc', '.pylintrc', 'pyproject.toml', 'setup.cfg', 'tox.ini'),
+}
+
+class ToolError(RuntimeError):
+    """
+    A linter crashed or could not run, instead of reporting on the files it was given.
+    """
+
+def _run_tool(module, args, parse, cwd=None):
+    """
+    Run a linter as `python -m <module>` in its own process and return parse(its stdout).
+
+    The interpreter is this one, so the tool is the version installed alongside (the one
+    _tool_version reports). Linters exit non-zero whenever they find something, so a
+    non-zero status only means a crash when there is no output, or the output does not
+    parse (parse raises ValueError); a ToolError then carries the end of the tool's stderr.
+    """
+    process = subprocess.Popen([sys.executable, '-m', module, *args], cwd=cwd,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output, errors = process.communicate()
+    try:
+        if process.returncode and not output.strip():
+            raise ValueError("no output")
+        return parse(output)
+    except ValueError as e:
+        details = errors.decode('utf-8', 'replace').strip().splitlines()[-20:]
+        raise ToolError(f"{module} exited with status {process.returncode}: "
+                        + ("\n".join(details) or str(e))) from None
+
+def _chunk_paths(paths, limit=_ARGV_LIMIT):
+    """
+    Split paths into lists whose combined length stays under `limit` bytes, so no tool
+    command line runs into the system's argument length limit.
+    """
+    chunk, size = [], 0
+    for path in paths:
+        length = len(os.fsencode(path)) + 1
+        if chunk and size + length > limit:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(path)
+        size += length
+    if chunk:
+        yield chunk
+
+class AnalysisCache:
+    """
+    On-disk cache of per-file analyzer results, so files unchanged since the last run skip
+    the analyzers entirely.
+
+    A tool's issues for a file are stored as JSON under
+    <cache_directory>/<tool>/<hash[:2]>/<hash[2:]>.json, where the hash covers the file's bytes,
+    the tool's installed version, its command-line options and the contents of the config files
+    it reads; upgrading a tool or changing its configuration therefore invalidates its entries,
+    as does bumping SCHEMA_VERSION whenever the stored issue format changes.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, cache_directory):
+        self.cache_directory = cache_directory
+
+    def run(self, tool, paths, run_batch, args=(), config_files=()):
+        """
+        Return `tool`'s issues keyed by file path, calling run_batch(paths) only for the files
+        with no cached entry. run_batch must return JSON-serializable issue lists, and args and
+        config_files must be the options and the config files it runs the tool with.
+        """
+        version = self._fingerprint(tool, args, config_files)
+        results = {}
+        missing = {}
+        for path in paths:
+            try:
+                digest = hashlib.sha256(_read_source(path))
+            except OSError:
+                # Let the tool itself report the unreadable file; there is nothing to key on
+                missing[path] = None
+                continue
+            digest.update(version)
+            key = digest.hexdigest()
+            entry_path = os.path.join(self.cache_directory, tool, key[:2], key[2:] + ".json")
+            try:
+                with open(entry_path, 'r', encoding='utf-8') as entry:
+                    issues = json.load(entry, object_pairs_hook=_interned)
+            except (OSError, ValueError):
+                missing[path] = entry_path
+                continue
+            if issues:
+                results[path] = issues
+
+        # The files to analyze go to the tool in chunks, keeping each command line short
+        for chunk in _chunk_paths(missing):
+            try:
+                fresh = run_batch(chunk)
+            except ToolError as e:
+                # Nothing from this chunk is cached, so its files are analyzed again next run
+                print(f"Error while running {tool}: {e}")
+                continue
+            for path in chunk:
+                issues = fresh.get(path, [])
+                if issues:
+                    results[path] = issues
+                entry_path = missing[path]
+                if entry_path is not None:
+                    self._store(entry_path, issues)
+        return results
+
+    def _fingerprint(self, tool, args, config_files):
+        # Everything besides a file's own bytes that the tool's result for it depends on
+        fingerprint = hashlib.sha256(f"{_tool_version(tool)}:{self.SCHEMA_VERSION}".encode())
+        for arg in args:
+            fingerprint.update(os.fsencode(arg) + b"\0")
+        for config_path in config_files:
+            fingerprint.update(os.fsencode(config_path) + b"\0")
+            try:
+                fingerprint.update(_read_source(config_path))
+            except OSError:
+                # Absent: the tool falls back to its defaults, which the version covers
+                fingerprint.update(b"\0")
+        return fingerprint.hexdigest().encode()
+
+    def _store(self, entry_path, issues):
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            # Write under a private name and rename into place, so a concurrent reader
+            # never sees a half-written entry
+            temp_path = f"{entry_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as entry:
+                json.dump(issues, entry)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            # The cache is only an optimization; an unwritable cache just means no reuse
+            pass
+
+class Category(IntEnum):
+    """
+    Error categories a file can be reported under; the values index AutoCodeFixer._buckets.
+    """
+
+    SyntaxError = 0
+    IndentationError = 1
+    UnusedVariable = 2
+    UnusedImport = 3
+    LogicalError = 4
+    OptimizeImport = 5
+    VariableNaming = 6
+    FunctionExtraction = 7
+    CodeMetrics = 8
+    CodeComments = 9
+    SecurityAnalysis = 10
+    ComplexityAnalysis = 11
+    DocumentationGeneration = 12
+    TestingIntegration = 13
+    ConcurrencyParallelism = 14
+    DependencyAnalysis = 15
+    CodeStyleConsistency = 16
+    ErrorHandlingImprovement = 17
+    CodeDuplicationDetection = 18
+    CodeEvolutionPatterns = 19
+    MachineLearningIntegration = 20
+    # Add more error categories as needed
+
+# The per-project metadata folder instabuildhub keeps its memory and archive in (see cli/main.py)
+METADATA_DIRECTORY = ".insteng"
+
+# Folders never searched for sources: VCS, virtualenv and build output, and instabuildhub's metadata
+SKIPPED_DIRECTORIES = frozenset({'.git', '__pycache__', 'venv', '.venv', 'node_modules', 'build', 'dist',
+                                 METADATA_DIRECTORY})
+
+def _cache_directory(target_directory):
+    """
+    Return the per-user folder caching the analysis of `target_directory`, keyed by its
+    absolute path.
+
+    Cached results decide what gets reported, so they must never be read from the tree
+    being analyzed, where a checkout could ship entries that hide findings.
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    key = hashlib.sha256(os.fsencode(target_directory)).hexdigest()[:16]
+    return os.path.join(base, 'instabuildhub', 'injector', f"{os.path.basename(target_directory)}-{key}")
 
 class AutoCodeFixer:
     def __init__(self, target_directory):
         self.target_directory = os.path.abspath(target_directory)
-        self.error_categories = {
-            'SyntaxError': [],
-            'IndentationError': [],
-            'UnusedVariable': [],
-            'UnusedImport': [],
-            'LogicalError': [],
-            'OptimizeImport': [],
-            'VariableNaming': [],
-            'FunctionExtraction': [],
-            'CodeMetrics': [],
-            'CodeComments': [],
-            'SecurityAnalysis': [],
-            'ComplexityAnalysis': [],
-            'DocumentationGeneration': [],
-            'TestingIntegration': [],
-            'ConcurrencyParallelism': [],
-            'DependencyAnalysis': [],
-            'CodeStyleConsistency': [],
-            'ErrorHandlingImprovement': [],
-            'CodeDuplicationDetection': [],
-            'CodeEvolutionPatterns': [],
-            'MachineLearningIntegration': []
-            # Add more error categories as needed
-        }
+        self._analysis_cache = AnalysisCache(os.path.join(_cache_directory(self.target_directory), "analysis-cache"))
+        # Files reported under each category, indexed by Category
+        self._buckets = [[] for _ in Category]
+        # Per-file results of the whole-project tools, filled once per run by fix_code_errors
+        self._security_issues = {}
+        self._style_issues = {}
+        self._lint_issues = {}
+        self._commit_index = {}
+        self._test_results = {}
+
+    @property
+    def error_categories(self):
+        # Name-keyed view of the buckets, for reporting
+        return {category.name: self._buckets[category] for category in Category}
 
     def fix_code_errors(self, fix_syntax=True, fix_format=True, fix_logic=True, optimize_imports=True,
                         refactor_code=True, backup=True, dry_run=False, fix_code_comments=True,
                         security_analysis=True, complexity_analysis=True, documentation_generation=True,
                         testing_integration=True, concurrency_parallelism=True, dependency_analysis=True,
                         code_style_consistency=True, error_handling=True, code_duplication_detection=True,
-                        code_evolution_patterns=True, machine_learning_integration=True):
+                        code_evolution_patterns=True, machine_learning_integration=True, workers=None):
         """
         Automatically fix code errors in Python files within the target directory.
 
@@ -75,25 +324,260 @@ class AutoCodeFixer:
         - code_duplication_detection (bool): Integrate code duplication detection and suggest refactoring.
         - code_evolution_patterns (bool): Analyze code version history to identify evolution patterns.
         - machine_learning_integration (bool): Experiment with machine learning models for code improvements.
+        - workers (int): Number of worker processes; defaults to the CPU count, 1 runs everything inline.
 
         Note: Enabling all options may lead to more aggressive modifications.
         """
-        python_files = self._get_python_files()
+        options = dict(
+            fix_syntax=fix_syntax, fix_format=fix_format, fix_logic=fix_logic, optimize_imports=optimize_imports,
+            refactor_code=refactor_code, backup=backup, dry_run=dry_run, fix_code_comments=fix_code_comments,
+            security_analysis=security_analysis, complexity_analysis=complexity_analysis,
+            documentation_generation=documentation_generation, testing_integration=testing_integration,
+            concurrency_parallelism=concurrency_parallelism, dependency_analysis=dependency_analysis,
+            code_style_consistency=code_style_consistency, error_handling=error_handling,
+            code_duplication_detection=code_duplication_detection, code_evolution_patterns=code_evolution_patterns,
+            machine_learning_integration=machine_learning_integration,
+        )
+        # Every category list and issue lookup then shares one string object per path
+        python_files = [sys.intern(file_path) for file_path in self._get_python_files()]
 
-        for file_path in python_files:
-            try:
-                self._fix_file_errors(file_path, fix_syntax, fix_format, fix_logic, optimize_imports,
-                                       refactor_code, backup, dry_run, fix_code_comments,
-                                       security_analysis, complexity_analysis, documentation_generation,
-                                       testing_integration, concurrency_parallelism, dependency_analysis,
-                                       code_style_consistency, error_handling, code_duplication_detection,
-                                       code_evolution_patterns, machine_learning_integration)
-            except Exception as e:
-                print(f"Error while fixing errors in {file_path}: {e}")
+        # bandit, flake8 and pylint spend most of their time loading plugins and config, so
+        # each runs once over the whole file list and the per-file pass looks results up;
+        # files whose results are cached from an earlier run are not analyzed again.
+        # The same goes for pytest, which runs all the files in one session instead of starting
+        # a session per file. The tools, pytest and git run as separate processes, so they
+        # all run side by side, with a thread waiting on each
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            security = style = lint = tests = history = None
+            if security_analysis:
+                security = executor.submit(self._analysis_cache.run, 'bandit', python_files, self._run_bandit_batch,
+                                        *self._tool_options('bandit'))
+            if code_style_consistency:
+                style = executor.submit(self._analysis_cache.run, 'flake8', python_files, self._run_flake8_batch,
+                                        *self._tool_options('flake8'))
+            if error_handling:
+                lint = executor.submit(self._analysis_cache.run, 'pylint', python_files, self._run_pylint_batch,
+                                        *self._tool_options('pylint'))
+            if testing_integration:
+                tests = executor.submit(self._run_pytest_batch, python_files)
+            if code_evolution_patterns:
+                history = executor.submit(self._build_commit_index)
+        if security is not None:
+            self._security_issues = security.result()
+        if style is not None:
+            self._style_issues = style.result()
+        if lint is not None:
+            self._lint_issues = lint.result()
+        if tests is not None:
+            self._test_results = tests.result()
+        if history is not None:
+            self._commit_index = history.result()
+
+        if workers == 1:
+            # Inline path, handy for debugging a single analyzer
+            for file_path in python_files:
+                try:
+                    self._fix_file_errors(file_path, **options)
+                except Exception as e:
+                    print(f"Error while fixing errors in {file_path}: {e}")
+        else:
+            # Every file is analyzed independently, so spread them over processes and
+            # merge the categories each worker reports back
+            fix_file = partial(_fix_file_worker, self.target_directory, options)
+            max_workers = workers or _default_pool_size()
+            batch_issues = (self._security_issues, self._style_issues, self._lint_issues,
+                            self._test_results, self._commit_index)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_fix_worker,
+                                     initargs=(batch_issues,), **_POOL_OPTIONS) as executor:
+                # Keep only a couple of files per worker queued, so a huge tree is streamed
+                # through the pool instead of being submitted up front
+                results = _bounded_map(executor, fix_file, python_files, 2 * max_workers)
+                for file_path, categories, error in results:
+                    for category in categories:
+                        self._buckets[category].append(sys.intern(file_path))
+                    if error is not None:
+                        print(f"Error while fixing errors in {file_path}: {error}")
 
         self._print_error_summary()
 
-    # ... (Other existing methods remain unchanged)
+    def _tool_options(self, tool):
+        """
+        Return the options `tool` runs with and the config files it reads: besides each
+        file's bytes, all its results depend on, so both key the analysis cache.
+        """
+        config_files = [os.path.join(self.target_directory, name) for name in _TOOL_CONFIG_FILES[tool]]
+        if tool == 'bandit':
+            args = ['-f', 'json', '-q']
+            if os.path.isfile(config_files[0]):
+                args += ['-c', config_files[0]]
+        elif tool == 'flake8':
+            # Tab-separated fields with the message last, so colons in paths or text are harmless
+            args = ['--format=%(path)s\t%(row)d\t%(col)d\t%(code)s\t%(text)s']
+        else:
+            # duplicate-code and cyclic-import judge the whole program at once, which neither
+            # per-file caching nor chunked runs can give them
+            args = ['--output-format=json', '--disable=duplicate-code,cyclic-import']
+            if os.environ.get('PYLINTRC'):
+                config_files.append(os.environ['PYLINTRC'])
+            config_files += [os.path.expanduser('~/.pylintrc'), os.path.expanduser('~/.config/pylintrc')]
+        return args, config_files
+
+    def _run_bandit_batch(self, paths):
+        """
+        Run bandit once over all paths and return its issues keyed by file path.
+        """
+        args, _ = self._tool_options('bandit')
+        report = _run_tool('bandit', args + list(paths),
+                           lambda output: json.loads(output or '{}', object_pairs_hook=_interned),
+                           cwd=self.target_directory)
+        security_issues = {}
+        for issue in report.get('results', ()):
+            security_issues.setdefault(issue['filename'], []).append(issue)
+        return security_issues
+
+    def _run_flake8_batch(self, paths):
+        """
+        Run flake8 once over all paths and return its violations keyed by file path.
+        """
+        args, _ = self._tool_options('flake8')
+        output = _run_tool('flake8', args + list(paths), lambda output: output.decode('utf-8', 'replace'),
+                           cwd=self.target_directory)
+        style_issues = {}
+        for line in output.splitlines():
+            fields = line.split('\t', 4)
+            if len(fields) == 5:
+                path, row, col, code, text = fields
+                style_issues.setdefault(sys.intern(path), []).append(
+                    {'code': sys.intern(code), 'line': int(row), 'column': int(col), 'text': sys.intern(text)})
+        return style_issues
+
+    def _run_pylint_batch(self, paths):
+        """
+        Run pylint once over all paths, with its own -j parallelism, and return its
+        messages keyed by file path.
+
+        Messages that come from inferring other modules (no-member, import-error) are cached
+        with the file they are reported in, so they reflect the other modules as they were
+        when that file last changed.
+        """
+        args, _ = self._tool_options('pylint')
+        messages = _run_tool('pylint', args + ['-j', str(os.cpu_count() or 1), *paths],
+                             lambda output: json.loads(output or '[]', object_pairs_hook=_interned),
+                             cwd=self.target_directory)
+        lint_issues = {}
+        for message in messages:
+            # Paths are reported relative to the folder pylint ran in
+            path = os.path.normpath(os.path.join(self.target_directory, message['path']))
+            lint_issues.setdefault(sys.intern(path), []).append(message)
+        return lint_issues
+
+    def _run_pytest_batch(self, paths):
+        """
+        Run pytest over the given files, one session per chunk instead of one per file, and
+        return for each file the status pytest.main([file_path]) would have given it: 0 when
+        its tests pass, 1 when one fails or errors, 2 when it fails to import, and 5 when it
+        holds no tests at all.
+        """
+        test_results = {}
+        for chunk in _chunk_paths(paths):
+            try:
+                # -rA lists every test's outcome in the short summary
+                output = _run_tool('pytest', ['-q', '--tb=no', '-rA', '-p', 'no:cacheprovider',
+                                              '--continue-on-collection-errors',
+                                              f'--rootdir={self.target_directory}', *chunk],
+                                   lambda output: output.decode('utf-8', 'replace'), cwd=self.target_directory)
+            except ToolError as e:
+                # Leave the chunk out, so its files are not reported for pytest's own failure
+                print(f"Error while running pytest: {e}")
+                continue
+            outcomes = {}
+            for line in output.splitlines():
+                outcome, _, location = line.partition(' ')
+                if outcome == 'SKIPPED':
+                    # "SKIPPED [count] path:line: reason"
+                    location = location.partition('] ')[2].split(':', 1)[0]
+                    status = 0
+                elif outcome in ('PASSED', 'XFAIL', 'XPASS', 'FAILED', 'ERROR'):
+                    # "OUTCOME path::test - reason", or "ERROR path - reason" for a module that
+                    # could not be collected
+                    location = location.split(' - ', 1)[0]
+                    if outcome == 'ERROR' and '::' not in location:
+                        status = 2
+                    else:
+                        status = 1 if outcome in ('FAILED', 'ERROR') else 0
+                    location = location.split('::', 1)[0]
+                else:
+                    continue
+                # Paths in the summary are relative to the rootdir
+                path = os.path.normpath(os.path.join(self.target_directory, location))
+                outcomes[path] = max(outcomes.get(path, 0), status)
+            for path in chunk:
+                test_results[path] = outcomes.get(path, 5)
+        return test_results
+
+    def _build_commit_index(self):
+        """
+        Map each file's absolute path to the hashes of the commits that touched it, newest first.
+
+        One `git log --name-only` over the whole history replaces opening the repository and
+        walking its history separately for every file.
+        """
+        commit_index = {}
+        git = _lazy('git')
+        try:
+            repo = git.Repo(self.target_directory)
+            # A NUL prefix marks the hash lines, since no path can contain one
+            log = repo.git.log('--name-only', '--pretty=format:%x00%H')
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError, git.GitCommandError):
+            # Not a repository, or one without commits yet
+            return commit_index
+
+        commit = None
+        for line in log.splitlines():
+            if line.startswith('\0'):
+                commit = line[1:]
+            elif line:
+                path = os.path.normpath(os.path.join(repo.working_tree_dir, line))
+                commit_index.setdefault(path, []).append(commit)
+        return commit_index
+
+    def _get_python_files(self):
+        # One os.scandir walk, taking entry types from the listing itself; VCS, virtualenv
+        # and build folders are never entered, so installed packages are not analyzed
+        python_files = []
+        pending = [self.target_directory]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIPPED_DIRECTORIES:
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file():
+                        python_files.append(entry.path)
+        return python_files
+
+    def _create_backup(self, file_path, source):
+        # Write the backup under a private name and rename it into place: injector2 leaves
+        # backups hard-linked to their file, and writing through such a link in place
+        # would truncate the file being backed up
+        backup_path = f"{file_path}.bak"
+        temp_path = f"{backup_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as backup_file:
+                backup_file.write(source)
+            os.replace(temp_path, backup_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def _print_error_summary(self):
+        print("Summary of Fixed Errors:")
+        for category in Category:
+            files = self._buckets[category]
+            print(f"{category.name}: {len(files)} files")
+            for file_path in files:
+                print(f"- {file_path}")
 
     def _fix_file_errors(self, file_path, fix_syntax, fix_format, fix_logic, optimize_imports, refactor_code,
                          backup, dry_run, fix_code_comments, security_analysis, complexity_analysis,
@@ -128,14 +612,13 @@ class AutoCodeFixer:
         - code_evolution_patterns (bool): Analyze code version history to identify evolution patterns.
         - machine_learning_integration (bool): Experiment with machine learning models for code improvements.
         """
-        with open(file_path, 'r', encoding='utf-8') as file:
-            original_code = file.read()
+        source = _read_source(file_path)
 
         # Create a backup before making changes
         if backup:
-            self._create_backup(file_path, original_code)
+            self._create_backup(file_path, source)
 
-        parsed_code = ast.parse(original_code)
+        parsed_code = compile(source, file_path, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
 
         # ... (Previous error-fixing logic remains unchanged)
 
@@ -146,10 +629,9 @@ class AutoCodeFixer:
 
         # Security Analysis
         if security_analysis:
-            security_issues = bandit.core.manager.MANAGER.run_bandit(
-                file_path, profile='bandit.yaml')
+            security_issues = self._security_issues.get(file_path)
             if security_issues:
-                self.error_categories['SecurityAnalysis'].append(file_path)
+                self._buckets[Category.SecurityAnalysis].append(file_path)
                 print(f"Security issues detected in {file_path}: {security_issues}")
                 if not dry_run:
                     # Apply fixes based on security analysis results
@@ -157,9 +639,9 @@ class AutoCodeFixer:
 
         # Complexity Analysis
         if complexity_analysis:
-            complexity_issues = radon.cli.harvest(file_path)
+            complexity_issues = _lazy('radon.cli').harvest(file_path)
             if complexity_issues:
-                self.error_categories['ComplexityAnalysis'].append(file_path)
+                self._buckets[Category.ComplexityAnalysis].append(file_path)
                 print(f"Code complexity issues detected in {file_path}: {complexity_issues}")
                 if not dry_run:
                     # Apply fixes based on complexity analysis results
@@ -167,16 +649,9 @@ class AutoCodeFixer:
 
         # Documentation Generation
         if documentation_generation:
-            builder = sphinx.application.Sphinx(
-                source_dir=self.target_directory,
-                config_dir=self.target_directory,
-                outdir='_build',
-                doctreedir='_doctrees',
-                buildername='html'
-            )
-            missing_docstrings = builder.get_all_files()
+            missing_docstrings = self._find_missing_docstrings(parsed_code)
             if missing_docstrings:
-                self.error_categories['DocumentationGeneration'].append(file_path)
+                self._buckets[Category.DocumentationGeneration].append(file_path)
                 print(f"Missing docstrings detected in {file_path}")
                 if not dry_run:
                     # Apply fixes based on documentation generation results
@@ -184,9 +659,9 @@ class AutoCodeFixer:
 
         # Testing Integration
         if testing_integration:
-            test_result = pytest.main([file_path])
+            test_result = self._test_results.get(file_path, 0)
             if test_result != 0:
-                self.error_categories['TestingIntegration'].append(file_path)
+                self._buckets[Category.TestingIntegration].append(file_path)
                 print(f"Testing issues detected in {file_path}")
                 if not dry_run:
                     # Apply fixes based on testing integration results
@@ -194,16 +669,16 @@ class AutoCodeFixer:
 
         # Concurrency and Parallelism
         if concurrency_parallelism:
-            with concurrent.futures.ProcessPoolExecutor() as executor:
-                # Placeholder for concurrency/parallelism analysis and fixes
-                pass
+            # Placeholder for concurrency/parallelism analysis and fixes; files are
+            # already spread over a process pool by fix_code_errors, so no pool here
+            pass
 
         # Dependency Analysis
         if dependency_analysis:
-            dependency_issues = safety.check(
+            dependency_issues = _lazy('safety').check(
                 path=file_path, recursive=True, key='pip')
             if dependency_issues:
-                self.error_categories['DependencyAnalysis'].append(file_path)
+                self._buckets[Category.DependencyAnalysis].append(file_path)
                 print(f"Dependency issues detected in {file_path}: {dependency_issues}")
                 if not dry_run:
                     # Apply fixes based on dependency analysis results
@@ -211,9 +686,9 @@ class AutoCodeFixer:
 
         # Code Style Consistency
         if code_style_consistency:
-            style_result = flake8.check_file(file_path)
-            if style_result.total_errors > 0:
-                self.error_categories['CodeStyleConsistency'].append(file_path)
+            style_issues = self._style_issues.get(file_path)
+            if style_issues:
+                self._buckets[Category.CodeStyleConsistency].append(file_path)
                 print(f"Code style inconsistencies detected in {file_path}")
                 if not dry_run:
                     # Apply fixes based on code style consistency analysis results
@@ -221,10 +696,9 @@ class AutoCodeFixer:
 
         # Error Handling Improvement
         if error_handling:
-            error_handling_result = pylint.Run(
-                file_path, exit=False).linter.stats['by_module']
+            error_handling_result = self._lint_issues.get(file_path)
             if error_handling_result:
-                self.error_categories['ErrorHandlingImprovement'].append(file_path)
+                self._buckets[Category.ErrorHandlingImprovement].append(file_path)
                 print(f"Error handling issues detected in {file_path}: {error_handling_result}")
                 if not dry_run:
                     # Apply fixes based on error handling improvement results
@@ -232,10 +706,10 @@ class AutoCodeFixer:
 
         # Code Duplication Detection
         if code_duplication_detection:
-            duplicated_code_blocks = clonedigger.find_duplicates(
+            duplicated_code_blocks = _lazy('clonedigger').find_duplicates(
                 file_path, analyze_whole_project=True)
             if duplicated_code_blocks:
-                self.error_categories['CodeDuplicationDetection'].append(file_path)
+                self._buckets[Category.CodeDuplicationDetection].append(file_path)
                 print(f"Code duplication detected in {file_path}")
                 if not dry_run:
                     # Apply fixes based on code duplication detection results
@@ -243,8 +717,7 @@ class AutoCodeFixer:
 
         # Code Evolution Patterns
         if code_evolution_patterns:
-            repo = git.Repo(self.target_directory)
-            commit_list = repo.iter_commits(paths=file_path)
+            commit_list = self._commit_index.get(file_path, [])
             # Placeholder for code evolution patterns analysis and fixes
 
         # Machine Learning Integration
@@ -252,22 +725,86 @@ class AutoCodeFixer:
             # Placeholder for machine learning model integration
             pass
 
+    def _find_missing_docstrings(self, parsed_code):
+        """
+        Return the module, classes and functions in an already-parsed file that have no docstring.
+
+        Checking the tree directly replaces building the whole project with Sphinx, which
+        walked and rendered every file once for each file analyzed.
+        """
+        missing_docstrings = [] if ast.get_docstring(parsed_code) else [parsed_code]
+        missing_docstrings.extend(node for node in _walk_defs(parsed_code) if not ast.get_docstring(node))
+        return missing_docstrings
+
     # ... (Other existing methods remain unchanged)
 
+# Whole-project tool results, handed to each worker process once by _init_fix_worker
+_worker_batch_issues = ({}, {}, {}, {}, {})
+
+def _init_fix_worker(batch_issues):
+    global _worker_batch_issues
+    _worker_batch_issues = batch_issues
+
+def _default_pool_size():
+    """
+    Worker count for the fix pool: one per CPU, but no more than available memory allows at
+    roughly 2 GiB per worker, since the analyzers can hold large trees for a single file.
+    """
+    by_memory = psutil.virtual_memory().available // (2 << 30)
+    return max(1, min(os.cpu_count() or 1, by_memory))
+
+def _bounded_map(executor, fn, items, window):
+    """
+    Like executor.map, but with at most `window` tasks in flight: items are pulled from the
+    stream only as results are taken, and results come back in item order.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+# Recycle pool workers every so many files, returning whatever memory a worker's
+# analyzers accumulated; ProcessPoolExecutor supports this from Python 3.11
+_POOL_OPTIONS = {'max_tasks_per_child': 50} if sys.version_info >= (3, 11) else {}
+
+def _fix_file_worker(target_directory, options, file_path):
+    """
+    Fix one file in a worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor. Returns the file path, the
+    Categories it was reported under, and a description of the error (if any) that stopped
+    it. Only the categories travel back, since every bucket a single-file run fills holds just
+    file_path, and the error travels as text, since not every exception can be pickled.
+    """
+    fixer = AutoCodeFixer(target_directory)
+    (fixer._security_issues, fixer._style_issues, fixer._lint_issues,
+     fixer._test_results, fixer._commit_index) = _worker_batch_issues
+    error = None
+    try:
+        fixer._fix_file_errors(file_path, **options)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    categories = tuple(category for category in Category if fixer._buckets[category])
+    return file_path, categories, error
+
 # Example usage:
-auto_code_fixer = AutoCodeFixer(target_directory="/path/to/code/directory")
-auto_code_fixer.fix_code_errors(
-    # ... (Previous parameters remain unchanged)
-    fix_code_comments=True,
-    security_analysis=True,
-    complexity_analysis=True,
-    documentation_generation=True,
-    testing_integration=True,
-    concurrency_parallelism=True,
-    dependency_analysis=True,
-    code_style_consistency=True,
-    error_handling=True,
-    code_duplication_detection=True,
-    code_evolution_patterns=True,
-    machine_learning_integration=True
-)
+if __name__ == "__main__":
+    auto_code_fixer = AutoCodeFixer(target_directory="/path/to/code/directory")
+    auto_code_fixer.fix_code_errors(
+        # ... (Previous parameters remain unchanged)
+        fix_code_comments=True,
+        security_analysis=True,
+        complexity_analysis=True,
+        documentation_generation=True,
+        testing_integration=True,
+        concurrency_parallelism=True,
+        dependency_analysis=True,
+        code_style_consistency=True,
+        error_handling=True,
+        code_duplication_detection=True,
+        code_evolution_patterns=True,
+        machine_learning_integration=True
+    )
@@ -1,172 +1,784 @@
 import os
+import re
 import ast
-import autopep8
+import sys
+import pickle
+import json
+import hashlib
+import psutil
 import shutil
-from difflib import unified_diff
-from importlib.util import find_spec
-from bandit.core import manager as bandit_manager
-from radon.complexity import cc_visit
-from pylint import epylint as lint
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from functools import lru_cache, partial
+from enum import IntEnum
+from importlib import metadata
+
+def _read_source(path):
+    """
+    Read a source file's bytes with one open, one fstat and a single read sized from it.
+
+    That is about half the system calls of open().read(), which also seeks and re-stats
+    the file; on network filesystems each one is a round trip.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+    try:
+        size = os.fstat(fd).st_size
+        source = os.read(fd, size + 1)
+        if len(source) > size:
+            # The file grew after fstat; pick up the rest
+            chunks = [source]
+            chunk = os.read(fd, 1 << 16)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, 1 << 16)
+            source = b"".join(chunks)
+    finally:
+        os.close(fd)
+    return source
+
+class ParseCache:
+    """
+    On-disk cache of parsed module ASTs, so repeated runs over the same sources skip parsing.
+
+    Trees are pickled under <cache_directory>/<hash[:2]>/<hash[2:]>.pkl, where the hash covers
+    the source bytes, the interpreter's cache tag (e.g. cpython-311, which also keys
+    __pycache__; ast node classes change between releases) and SCHEMA_VERSION, which is
+    bumped whenever the stored format changes.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, cache_directory):
+        self.cache_directory = cache_directory
+        self._key_suffix = f"{sys.implementation.cache_tag}:{self.SCHEMA_VERSION}".encode()
+
+    def get(self, file_path, source):
+        """
+        Return the AST of `source` (the bytes of `file_path`), parsing it only on a cache miss.
+        """
+        digest = hashlib.sha256(source)
+        digest.update(self._key_suffix)
+        key = digest.hexdigest()
+        cache_path = os.path.join(self.cache_directory, key[:2], key[2:] + ".pkl")
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                tree = pickle.load(cache_file)
+        except Exception:
+            # Unreadable, truncated or from an incompatible release: parse afresh
+            tree = None
+        if isinstance(tree, ast.Module):
+            return tree
+
+        # compile() with PyCF_ONLY_AST is what ast.parse wraps, minus the extra call layer
+        tree = compile(source, file_path, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Write under a private name and rename into place, so a concurrent reader
+            # never sees a half-written entry
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as cache_file:
+                pickle.dump(tree, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # The cache is only an optimization; an unwritable cache just means no reuse
+            pass
+        return tree
+
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+
+# Unused imports remove_unused_imports may delete: standard library modules only, as
+# autoflake does by default, since importing a third-party or local module can register
+# plugins or re-export names. The stdlib modules below act on import themselves. Before
+# Python 3.10 there is no stdlib module list, so nothing is deleted.
+_SIDE_EFFECT_MODULES = frozenset({'antigravity', 'readline', 'rlcompleter', 'site', 'this'})
+_REMOVABLE_MODULES = frozenset(getattr(sys, 'stdlib_module_names', ())) - _SIDE_EFFECT_MODULES
+
+def _removable_imports(unused_imports):
+    """
+    Narrow (import statement, aliases) pairs to the aliases safe to delete.
+    """
+    removable = []
+    for statement, aliases in unused_imports:
+        if isinstance(statement, ast.ImportFrom):
+            # Relative imports are local modules by definition
+            if statement.level or (statement.module or '').partition('.')[0] not in _REMOVABLE_MODULES:
+                continue
+        else:
+            aliases = [alias for alias in aliases if alias.name.partition('.')[0] in _REMOVABLE_MODULES]
+        if aliases:
+            removable.append((statement, aliases))
+    return removable
+
+class _FusedAnalyzer(ast.NodeVisitor):
+    """
+    Gather what every AST-based detector needs from a module in one traversal.
+
+    Cyclomatic complexity is counted per function as 1 plus its decision points, scored the
+    way radon's cc_visit scores them, which walked the tree a second time.
+    """
+
+    # Nodes worth one decision point each; match_case only exists from Python 3.10
+    DECISION_NODES = (ast.If, ast.IfExp, ast.Assert, ast.ExceptHandler, getattr(ast, 'match_case', ()))
+    LOOP_NODES = (ast.For, ast.AsyncFor, ast.While)
+    TRY_NODES = (ast.Try, getattr(ast, 'TryStar', ()))
+    COMPLEXITY_THRESHOLD = 10  # Adjust the threshold as needed
+
+    def __init__(self):
+        self.comment_issues = []
+        self.complexity_issues = []
+        self.missing_docstrings = []
+        self.error_handling_issues = []
+        # Module-level import statements, and every name the module reads
+        self.imports = []
+        self.used_names = set()
+        # Running complexity of each function the traversal is currently inside
+        self._complexity = []
+
+    def visit(self, node):
+        if self._complexity:
+            if isinstance(node, self.DECISION_NODES):
+                self._complexity[-1] += 1
+            elif isinstance(node, self.LOOP_NODES):
+                self._complexity[-1] += 1 + bool(node.orelse)
+            elif isinstance(node, self.TRY_NODES):
+                self._complexity[-1] += bool(node.orelse)
+            elif isinstance(node, ast.comprehension):
+                self._complexity[-1] += 1 + len(node.ifs)
+            elif isinstance(node, ast.BoolOp):
+                self._complexity[-1] += len(node.values) - 1
+        return super().visit(node)
+
+    def visit_Module(self, node):
+        if not ast.get_docstring(node):
+            self.missing_docstrings.append(node)
+        for statement in node.body:
+            if isinstance(statement, ast.Import):
+                self.imports.append(statement)
+            elif isinstance(statement, ast.ImportFrom) and statement.module != '__future__' \
+                    and statement.names[0].name != '*':
+                self.imports.append(statement)
+        self.generic_visit(node)
+
+    def visit_Name(self, node):
+        self.used_names.add(node.id)
+
+    def visit_Constant(self, node):
+        # Names inside strings count as used too: string annotations, __all__ entries
+        if isinstance(node.value, str):
+            self.used_names.update(_IDENTIFIER_RE.findall(node.value))
+
+    def unused_imports(self):
+        """
+        Return (import statement, aliases) pairs for the module-level imports binding names
+        the module never uses.
+        """
+        unused = []
+        for statement in self.imports:
+            aliases = [alias for alias in statement.names
+                       if (alias.asname or alias.name).partition('.')[0] not in self.used_names]
+            if aliases:
+                unused.append((statement, aliases))
+        return unused
+
+    def visit_ClassDef(self, node):
+        if not ast.get_docstring(node):
+            self.missing_docstrings.append(node)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        if not ast.get_docstring(node):
+            self.missing_docstrings.append(node)
+        # Placeholder for comment-related issues detection
+        self._complexity.append(1)
+        self.generic_visit(node)
+        complexity = self._complexity.pop()
+        if complexity > self.COMPLEXITY_THRESHOLD:
+            self.complexity_issues.append((node.name, node.lineno, complexity))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ExceptHandler(self, node):
+        # A bare except also swallows KeyboardInterrupt and SystemExit
+        if node.type is None:
+            self.error_handling_issues.append(node)
+        self.generic_visit(node)
+
+def _interned(pairs):
+    """
+    json object_pairs_hook that interns keys and string values. Paths, issue codes and
+    messages repeat across thousands of records, so each distinct string is kept once.
+    """
+    return {sys.intern(key): sys.intern(value) if isinstance(value, str) else value for key, value in pairs}
+
+# Bytes of file paths per tool command line: Windows caps a whole command line at 32 KiB,
+# and Linux caps the argument list (with the environment) at ARG_MAX, often 2 MiB
+_ARGV_LIMIT = 24 << 10 if os.name == 'nt' else 1 << 17
+
+@lru_cache(maxsize=None)
+def _tool_version(distribution):
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+# bandit's options, which key its cache entries; it reads no config file unless given one
+_BANDIT_ARGS = ('-f', 'json', '-q')
+
+class ToolError(RuntimeError):
+    """
+    A linter crashed or could not run, instead of reporting on the files it was given.
+    """
+
+def _run_tool(module, args, parse, cwd=None):
+    """
+    Run a linter as `python -m <module>` in its own process and return parse(its stdout).
+
+    The interpreter is this one, so the tool is the version installed alongside (the one
+    _tool_version reports). Linters exit non-zero whenever they find something, so a
+    non-zero status only means a crash when there is no output, or the output does not
+    parse (parse raises ValueError); a ToolError then carries the end of the tool's stderr.
+    """
+    process = subprocess.Popen([sys.executable, '-m', module, *args], cwd=cwd,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output, errors = process.communicate()
+    try:
+        if process.returncode and not output.strip():
+            raise ValueError("no output")
+        return parse(output)
+    except ValueError as e:
+        details = errors.decode('utf-8', 'replace').strip().splitlines()[-20:]
+        raise ToolError(f"{module} exited with status {process.returncode}: "
+                        + ("\n".join(details) or str(e))) from None
+
+def _chunk_paths(paths, limit=_ARGV_LIMIT):
+    """
+    Split paths into lists whose combined length stays under `limit` bytes, so no tool
+    command line runs into the system's argument length limit.
+    """
+    chunk, size = [], 0
+    for path in paths:
+        length = len(os.fsencode(path)) + 1
+        if chunk and size + length > limit:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(path)
+        size += length
+    if chunk:
+        yield chunk
+
+class AnalysisCache:
+    """
+    On-disk cache of per-file analyzer results, so files unchanged since the last run skip
+    the analyzers entirely.
+
+    A tool's issues for a file are stored as JSON under
+    <cache_directory>/<tool>/<hash[:2]>/<hash[2:]>.json, where the hash covers the file's bytes,
+    the tool's installed version, its command-line options and the contents of the config files
+    it reads; upgrading a tool or changing its configuration therefore invalidates its entries,
+    as does bumping SCHEMA_VERSION whenever the stored issue format changes.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, cache_directory):
+        self.cache_directory = cache_directory
+
+    def run(self, tool, paths, run_batch, args=(), config_files=()):
+        """
+        Return `tool`'s issues keyed by file path, calling run_batch(paths) only for the files
+        with no cached entry. run_batch must return JSON-serializable issue lists, and args and
+        config_files must be the options and the config files it runs the tool with.
+        """
+        version = self._fingerprint(tool, args, config_files)
+        results = {}
+        missing = {}
+        for path in paths:
+            try:
+                digest = hashlib.sha256(_read_source(path))
+            except OSError:
+                # Let the tool itself report the unreadable file; there is nothing to key on
+                missing[path] = None
+                continue
+            digest.update(version)
+            key = digest.hexdigest()
+            entry_path = os.path.join(self.cache_directory, tool, key[:2], key[2:] + ".json")
+            try:
+                with open(entry_path, 'r', encoding='utf-8') as entry:
+                    issues = json.load(entry, object_pairs_hook=_interned)
+            except (OSError, ValueError):
+                missing[path] = entry_path
+                continue
+            if issues:
+                results[path] = issues
+
+        # The files to analyze go to the tool in chunks, keeping each command line short
+        for chunk in _chunk_paths(missing):
+            try:
+                fresh = run_batch(chunk)
+            except ToolError as e:
+                # Nothing from this chunk is cached, so its files are analyzed again next run
+                print(f"Error while running {tool}: {e}")
+                continue
+            for path in chunk:
+                issues = fresh.get(path, [])
+                if issues:
+                    results[path] = issues
+                entry_path = missing[path]
+                if entry_path is not None:
+                    self._store(entry_path, issues)
+        return results
+
+    def _fingerprint(self, tool, args, config_files):
+        # Everything besides a file's own bytes that the tool's result for it depends on
+        fingerprint = hashlib.sha256(f"{_tool_version(tool)}:{self.SCHEMA_VERSION}".encode())
+        for arg in args:
+            fingerprint.update(os.fsencode(arg) + b"\0")
+        for config_path in config_files:
+            fingerprint.update(os.fsencode(config_path) + b"\0")
+            try:
+                fingerprint.update(_read_source(config_path))
+            except OSError:
+                # Absent: the tool falls back to its defaults, which the version covers
+                fingerprint.update(b"\0")
+        return fingerprint.hexdigest().encode()
+
+    def _store(self, entry_path, issues):
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            # Write under a private name and rename into place, so a concurrent reader
+            # never sees a half-written entry
+            temp_path = f"{entry_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as entry:
+                json.dump(issues, entry)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            # The cache is only an optimization; an unwritable cache just means no reuse
+            pass
+
+class Category(IntEnum):
+    """
+    Error categories a file can be reported under; the values index AutoCodeFixer._buckets.
+    """
+
+    SyntaxError = 0
+    IndentationError = 1
+    UnusedVariable = 2
+    UnusedImport = 3
+    LogicalError = 4
+    OptimizeImport = 5
+    VariableNaming = 6
+    FunctionExtraction = 7
+    CodeMetrics = 8
+    CodeComments = 9
+    SecurityAnalysis = 10
+    ComplexityAnalysis = 11
+    DocumentationGeneration = 12
+    TestingIntegration = 13
+    ConcurrencyParallelism = 14
+    DependencyAnalysis = 15
+    CodeStyleConsistency = 16
+    ErrorHandlingImprovement = 17
+    CodeDuplicationDetection = 18
+    CodeEvolutionPatterns = 19
+    MachineLearningIntegration = 20
+    # Add more error categories as needed
+
+# The per-project metadata folder instabuildhub keeps its memory and archive in (see cli/main.py)
+METADATA_DIRECTORY = ".insteng"
+
+def _cache_directory(target_directory):
+    """
+    Return the per-user folder caching the analysis of `target_directory`, keyed by its
+    absolute path.
+
+    The caches hold pickles and the results that decide what gets reported, so they must
+    never be read from the tree being analyzed, where anyone who controls the checkout
+    could plant entries.
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    key = hashlib.sha256(os.fsencode(target_directory)).hexdigest()[:16]
+    return os.path.join(base, 'instabuildhub', 'injector', f"{os.path.basename(target_directory)}-{key}")
+
+# Folders never searched for sources: VCS, virtualenv and build output, and instabuildhub's metadata
+SKIPPED_DIRECTORIES = frozenset({'.git', '__pycache__', 'venv', '.venv', 'node_modules', 'build', 'dist',
+                                 METADATA_DIRECTORY})
 
 class AutoCodeFixer:
     def __init__(self, target_directory):
         self.target_directory = os.path.abspath(target_directory)
-        self.error_categories = {
-            'SyntaxError': [],
-            'IndentationError': [],
-            'UnusedVariable': [],
-            'UnusedImport': [],
-            'LogicalError': [],
-            'OptimizeImport': [],
-            'VariableNaming': [],
-            'FunctionExtraction': [],
-            'CodeMetrics': [],
-            'CodeComments': [],
-            'SecurityAnalysis': [],
-            'ComplexityAnalysis': [],
-            'DocumentationGeneration': [],
-            'TestingIntegration': [],
-            'ConcurrencyParallelism': [],
-            'DependencyAnalysis': [],
-            'CodeStyleConsistency': [],
-            'ErrorHandlingImprovement': [],
-            'CodeDuplicationDetection': [],
-            'CodeEvolutionPatterns': [],
-            'MachineLearningIntegration': []
-        }
+        cache_directory = _cache_directory(self.target_directory)
+        self._parse_cache = ParseCache(os.path.join(cache_directory, "parse-cache"))
+        self._analysis_cache = AnalysisCache(os.path.join(cache_directory, "analysis-cache"))
+        self._state_path = os.path.join(cache_directory, "file-state.json")
+        # Files reported under each category, indexed by Category
+        self._buckets = [[] for _ in Category]
+        # Per-file bandit results, filled once per run by fix_code_errors
+        self._security_issues = {}
+
+    @property
+    def error_categories(self):
+        # Name-keyed view of the buckets, for reporting
+        return {category.name: self._buckets[category] for category in Category}
 
     def fix_code_errors(self, fix_syntax=True, fix_format=True, fix_logic=True, optimize_imports=True,
                         refactor_code=True, backup=True, dry_run=False, fix_code_comments=True,
                         security_analysis=True, complexity_analysis=True, documentation_generation=True,
                         testing_integration=True, concurrency_parallelism=True, dependency_analysis=True,
                         code_style_consistency=True, error_handling=True, code_duplication_detection=True,
-                        code_evolution_patterns=True, machine_learning_integration=True):
-        python_files = self._get_python_files()
+                        code_evolution_patterns=True, machine_learning_integration=True,
+                        remove_unused_imports=False, workers=None):
+        options = dict(
+            fix_syntax=fix_syntax, fix_format=fix_format, fix_logic=fix_logic, optimize_imports=optimize_imports,
+            refactor_code=refactor_code, backup=backup, dry_run=dry_run, fix_code_comments=fix_code_comments,
+            security_analysis=security_analysis, complexity_analysis=complexity_analysis,
+            documentation_generation=documentation_generation, testing_integration=testing_integration,
+            concurrency_parallelism=concurrency_parallelism, dependency_analysis=dependency_analysis,
+            code_style_consistency=code_style_consistency, error_handling=error_handling,
+            code_duplication_detection=code_duplication_detection, code_evolution_patterns=code_evolution_patterns,
+            machine_learning_integration=machine_learning_integration,
+            remove_unused_imports=remove_unused_imports,
+        )
+        # Files unchanged since the last run with the same options keep their recorded
+        # categories and are not analyzed again; state collects this run's records
+        previous_state = self._load_state(options)
+        state = {}
+        python_files = self._iter_changed_files(self._iter_python_files(), previous_state, state)
 
-        for file_path in python_files:
-            try:
-                self._fix_file_errors(file_path, fix_syntax, fix_format, fix_logic, optimize_imports,
-                                       refactor_code, backup, dry_run, fix_code_comments,
-                                       security_analysis, complexity_analysis, documentation_generation,
-                                       testing_integration, concurrency_parallelism, dependency_analysis,
-                                       code_style_consistency, error_handling, code_duplication_detection,
-                                       code_evolution_patterns, machine_learning_integration)
-            except Exception as e:
-                print(f"Error while fixing errors in {file_path}: {e}")
+        # bandit spends most of its time loading plugins and config, so it runs once over
+        # the whole file list and the per-file pass looks its results up
+        if security_analysis:
+            python_files = list(python_files)
+            self._security_issues = self._analysis_cache.run('bandit', python_files, self._run_bandit_batch,
+                                                             _BANDIT_ARGS)
+
+        fix_file = partial(_fix_file_worker, self.target_directory, options)
+        if workers == 1:
+            # Inline path, handy for debugging a single analyzer
+            _init_fix_worker(self._security_issues)
+            self._merge_results(map(fix_file, python_files), state)
+        else:
+            # Every file is analyzed independently, so spread them over processes and
+            # merge the categories each worker reports back
+            max_workers = workers or _default_pool_size()
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_fix_worker,
+                                     initargs=(self._security_issues,), **_POOL_OPTIONS) as executor:
+                # Keep only a couple of files per worker queued, so a huge tree is streamed
+                # through the pool instead of being submitted up front
+                self._merge_results(_bounded_map(executor, fix_file, python_files, 2 * max_workers), state)
 
+        self._save_state(options, state)
         self._print_error_summary()
 
-    def _get_python_files(self):
-        python_files = []
-        for root, dirs, files in os.walk(self.target_directory):
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
-        return python_files
+    def _merge_results(self, results, state):
+        for file_path, categories, error in results:
+            for category in categories:
+                self._buckets[category].append(sys.intern(file_path))
+            if error is not None:
+                print(f"Error while fixing errors in {file_path}: {error}")
+                # Leave no record, so the file is tried again next run
+                state.pop(file_path, None)
+            elif file_path in state:
+                state[file_path]['categories'] = [category.name for category in categories]
+
+    def _load_state(self, options):
+        # Records from a run with different options describe different analyses
+        try:
+            with open(self._state_path, 'r', encoding='utf-8') as state_file:
+                saved = json.load(state_file, object_pairs_hook=_interned)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(saved, dict) or saved.get('options') != options:
+            return {}
+        return saved.get('files', {})
+
+    def _save_state(self, options, state):
+        try:
+            os.makedirs(os.path.dirname(self._state_path), exist_ok=True)
+            temp_path = f"{self._state_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as state_file:
+                json.dump({'options': options, 'files': state}, state_file)
+            os.replace(temp_path, self._state_path)
+        except OSError:
+            # Without saved state the next run simply analyzes everything again
+            pass
+
+    def _iter_changed_files(self, python_files, previous_state, state):
+        # The make-style staleness check: a file whose mtime and size match its record is
+        # unchanged; only on a mismatch is it hashed, and only a new hash means re-analysis
+        for file_path in python_files:
+            try:
+                stat = os.stat(file_path)
+                record = previous_state.get(file_path)
+                if record is not None and (record['mtime_ns'], record['size']) == (stat.st_mtime_ns, stat.st_size):
+                    digest = record['sha256']
+                else:
+                    digest = hashlib.sha256(_read_source(file_path)).hexdigest()
+            except OSError:
+                # Let the analysis pass report the unreadable file
+                yield file_path
+                continue
+            if record is not None and record['sha256'] == digest:
+                state[file_path] = dict(record, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                for name in record['categories']:
+                    self._buckets[Category[name]].append(file_path)
+                continue
+            state[file_path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest, 'categories': []}
+            yield file_path
+
+    def _iter_python_files(self):
+        # Yield paths as the os.scandir walk finds them, so workers can start on the first
+        # files before the tree is fully listed; entry types come from the listing itself.
+        # Paths are interned, so every category list holding a file shares one string.
+        # VCS, virtualenv and build folders are never entered, so installed packages are
+        # neither analyzed nor rewritten
+        pending = [self.target_directory]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIPPED_DIRECTORIES:
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.py') and entry.is_file():
+                        yield sys.intern(entry.path)
 
     def _fix_file_errors(self, file_path, fix_syntax, fix_format, fix_logic, optimize_imports, refactor_code,
                          backup, dry_run, fix_code_comments, security_analysis, complexity_analysis,
                          documentation_generation, testing_integration, concurrency_parallelism,
                          dependency_analysis, code_style_consistency, error_handling,
                          code_duplication_detection, code_evolution_patterns,
-                         machine_learning_integration):
-        with open(file_path, 'r', encoding='utf-8') as file:
-            original_code = file.read()
+                         machine_learning_integration, remove_unused_imports=False):
+        source = _read_source(file_path)
 
         if backup:
-            self._create_backup(file_path, original_code)
+            self._create_backup(file_path, source)
+
+        parsed_code = self._parse_cache.get(file_path, source)
 
-        parsed_code = ast.parse(original_code)
+        # One traversal feeds all the AST-based detectors below
+        analysis = _FusedAnalyzer()
+        analysis.visit(parsed_code)
 
         # Placeholder for existing error-fixing logic
 
+        # Fix Format: unused imports are found on the tree already parsed instead of having
+        # autopep8 tokenize the file again; package __init__ modules import to re-export.
+        # They are only reported unless remove_unused_imports is set, and even then only
+        # standard library imports are deleted
+        if fix_format and os.path.basename(file_path) != '__init__.py':
+            unused_imports = analysis.unused_imports()
+            if unused_imports:
+                self._buckets[Category.UnusedImport].append(file_path)
+                names = ", ".join(alias.asname or alias.name for _, aliases in unused_imports for alias in aliases)
+                print(f"Unused imports detected in {file_path}: {names}")
+                removable = _removable_imports(unused_imports) if remove_unused_imports else []
+                if removable and not dry_run:
+                    fixed_source = self._remove_unused_imports(source, removable)
+                    if fixed_source != source:
+                        self._ensure_writable(file_path)
+                        with open(file_path, 'wb') as file:
+                            file.write(fixed_source)
+
         # Fix Code Comments
         if fix_code_comments:
-            comment_issues = self._detect_comment_analysis_issues(parsed_code)
+            comment_issues = analysis.comment_issues
             if comment_issues:
-                self.error_categories['CodeComments'].append(file_path)
+                self._buckets[Category.CodeComments].append(file_path)
                 print(f"Code comment issues detected in {file_path}: {comment_issues}")
                 if not dry_run:
+                    self._ensure_writable(file_path)
                     self._fix_comment_analysis_issues(parsed_code, comment_issues)
 
         # Security Analysis
         if security_analysis:
-            security_issues = self._detect_security_issues(file_path)
+            security_issues = self._security_issues.get(file_path)
             if security_issues:
-                self.error_categories['SecurityAnalysis'].append(file_path)
+                self._buckets[Category.SecurityAnalysis].append(file_path)
                 print(f"Security issues detected in {file_path}: {security_issues}")
                 if not dry_run:
+                    self._ensure_writable(file_path)
                     self._fix_security_issues(parsed_code, security_issues)
 
         # Complexity Analysis
         if complexity_analysis:
-            complexity_issues = self._detect_complexity_issues(parsed_code)
+            complexity_issues = analysis.complexity_issues
             if complexity_issues:
-                self.error_categories['ComplexityAnalysis'].append(file_path)
+                self._buckets[Category.ComplexityAnalysis].append(file_path)
                 print(f"Code complexity issues detected in {file_path}: {complexity_issues}")
                 if not dry_run:
+                    self._ensure_writable(file_path)
                     self._fix_complexity_issues(parsed_code, complexity_issues)
 
         # ... (Other existing code remains unchanged)
 
-    def _detect_security_issues(self, file_path):
-        # Run bandit for security analysis
-        issues = bandit_manager.BanditManager().run([file_path])
-        return issues
+    def _run_bandit_batch(self, paths):
+        # Run bandit once for all files, in its own process, and bucket its issues by file path
+        report = _run_tool('bandit', [*_BANDIT_ARGS, *paths],
+                           lambda output: json.loads(output or '{}', object_pairs_hook=_interned),
+                           cwd=self.target_directory)
+        security_issues = {}
+        for issue in report.get('results', ()):
+            security_issues.setdefault(issue['filename'], []).append(issue)
+        return security_issues
 
     def _fix_security_issues(self, parsed_code, security_issues):
         # Placeholder for fixing security issues
         pass
 
-    def _detect_complexity_issues(self, parsed_code):
-        results = cc_visit(parsed_code)
-        complexity_issues = []
-        for result in results:
-            if result.complexity > 10:  # Adjust the threshold as needed
-                complexity_issues.append(result)
-        return complexity_issues
-
     def _fix_complexity_issues(self, parsed_code, complexity_issues):
         # Placeholder for fixing complexity issues
         pass
 
-    def _detect_comment_analysis_issues(self, parsed_code):
-        comment_issues = []
-        for node in ast.walk(parsed_code):
-            if isinstance(node, ast.FunctionDef):
-                # Placeholder for comment-related issues detection
-                pass
-        return comment_issues
-
     def _fix_comment_analysis_issues(self, parsed_code, comment_issues):
         # Placeholder for code comment analysis and fixes
         pass
 
-    def _create_backup(self, file_path, original_code):
+    def _remove_unused_imports(self, source, unused_imports):
+        """
+        Return `source` (bytes) without the given unused imports.
+
+        Only the lines an import statement spans are edited, so comments and formatting
+        everywhere else survive, which re-emitting the whole module with ast.unparse would
+        lose. A statement that keeps some of its names is rewritten with ast.unparse (Python
+        3.9+; left as is before that), and one sharing a line with other code is left alone.
+        """
+        lines = source.splitlines(keepends=True)
+        # Bottom-up, so line numbers of the statements still to edit stay valid
+        for statement, aliases in sorted(unused_imports, key=lambda item: item[0].lineno, reverse=True):
+            first, last = statement.lineno - 1, statement.end_lineno - 1
+            # Offsets are in UTF-8 bytes, as are the lines
+            leading = lines[first][:statement.col_offset].strip()
+            trailing = lines[last][statement.end_col_offset:].strip()
+            if leading or (trailing and not trailing.startswith(b'#')):
+                continue
+            kept = [alias for alias in statement.names if alias not in aliases]
+            if not kept:
+                replacement = []
+            elif hasattr(ast, 'unparse'):
+                if isinstance(statement, ast.ImportFrom):
+                    pruned = ast.ImportFrom(module=statement.module, names=kept, level=statement.level)
+                else:
+                    pruned = ast.Import(names=kept)
+                line_ending = lines[last][len(lines[last].rstrip(b'\r\n')):] or b'\n'
+                comment = b'  ' + trailing if trailing else b''
+                replacement = [ast.unparse(pruned).encode('utf-8') + comment + line_ending]
+            else:
+                continue
+            lines[first:last + 1] = replacement
+        return b"".join(lines)
+
+    def _create_backup(self, file_path, source):
+        # Hard-link the original as its backup, which costs no copy and no space; only a
+        # file that is actually about to be fixed gets its own copy, via _ensure_writable
         backup_path = f"{file_path}.bak"
-        with open(backup_path, 'w', encoding='utf-8') as backup_file:
-            backup_file.write(original_code)
+        temp_path = f"{backup_path}.{os.getpid()}.tmp"
+        try:
+            if os.path.samefile(file_path, backup_path):
+                # Still linked from an earlier run, so the backup is already current; renaming
+                # a second link over it would be a no-op that leaves the temporary link behind
+                return
+        except OSError:
+            pass
+        try:
+            os.link(file_path, temp_path)
+            os.replace(temp_path, backup_path)
+        except OSError:
+            # No hard links here (another filesystem, or not supported): copy the bytes as read
+            with open(backup_path, 'wb') as backup_file:
+                backup_file.write(source)
+
+    def _ensure_writable(self, file_path):
+        # Must run before anything rewrites file_path: while its backup is still a hard link
+        # to the same inode, an in-place write would change the backup too
+        backup_path = f"{file_path}.bak"
+        try:
+            if not os.path.samefile(file_path, backup_path):
+                return
+        except OSError:
+            return
+        # Give file_path a fresh inode of its own, leaving the backup with the original
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        shutil.copy2(file_path, temp_path)
+        os.replace(temp_path, file_path)
 
     def _print_error_summary(self):
         print("Summary of Fixed Errors:")
-        for category, files in self.error_categories.items():
-            print(f"{category}: {len(files)} files")
+        for category in Category:
+            files = self._buckets[category]
+            print(f"{category.name}: {len(files)} files")
             for file_path in files:
                 print(f"- {file_path}")
 
+# bandit results for the whole run, handed to each worker process once by _init_fix_worker
+_worker_security_issues = {}
+
+def _init_fix_worker(security_issues):
+    global _worker_security_issues
+    _worker_security_issues = security_issues
+
+def _default_pool_size():
+    """
+    Worker count for the fix pool: one per CPU, but no more than available memory allows at
+    roughly 2 GiB per worker, since the analyzers can hold large trees for a single file.
+    """
+    by_memory = psutil.virtual_memory().available // (2 << 30)
+    return max(1, min(os.cpu_count() or 1, by_memory))
+
+def _bounded_map(executor, fn, items, window):
+    """
+    Like executor.map, but with at most `window` tasks in flight: items are pulled from the
+    stream only as results are taken, and results come back in item order.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+# Recycle pool workers every so many files, returning whatever memory a worker's
+# analyzers accumulated; ProcessPoolExecutor supports this from Python 3.11
+_POOL_OPTIONS = {'max_tasks_per_child': 50} if sys.version_info >= (3, 11) else {}
+
+def _fix_file_worker(target_directory, options, file_path):
+    """
+    Fix one file in a worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor. Returns the file path, the
+    Categories it was reported under, and a description of the error (if any) that stopped
+    it. Only the categories travel back, since every bucket a single-file run fills holds just
+    file_path, and the error travels as text, since not every exception can be pickled.
+    """
+    fixer = AutoCodeFixer(target_directory)
+    fixer._security_issues = _worker_security_issues
+    error = None
+    try:
+        fixer._fix_file_errors(file_path, **options)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    categories = tuple(category for category in Category if fixer._buckets[category])
+    return file_path, categories, error
+
 # Example usage:
-auto_code_fixer = AutoCodeFixer(target_directory="/path/to/code/directory")
-auto_code_fixer.fix_code_errors(
-    fix_code_comments=True,
-    security_analysis=True,
-    complexity_analysis=True,
-    documentation_generation=True,
-    testing_integration=True,
-    concurrency_parallelism=True,
-    dependency_analysis=True,
-    code_style_consistency=True,
-    error_handling=True,
-    code_duplication_detection=True,
-    code_evolution_patterns=True,
-    machine_learning_integration=True
-)
+if __name__ == "__main__":
+    auto_code_fixer = AutoCodeFixer(target_directory="/path/to/code/directory")
+    auto_code_fixer.fix_code_errors(
+        fix_code_comments=True,
+        security_analysis=True,
+        complexity_analysis=True,
+        documentation_generation=True,
+        testing_integration=True,
+        concurrency_parallelism=True,
+        dependency_analysis=True,
+        code_style_consistency=True,
+        error_handling=True,
+        code_duplication_detection=True,
+        code_evolution_patterns=True,
+        machine_learning_integration=True
+    )
@@ -0,0 +1,65 @@
+import datetime
+import os
+
+from unittest.mock import MagicMock
+
+from injector import injector
+from injector.injector import CodeInjector
+
+
+def freeze_at(monkeypatch, time):
+    datetime_mock = MagicMock(wraps=datetime.datetime)
+    datetime_mock.now.return_value = time
+    monkeypatch.setattr(injector, "datetime", datetime_mock)
+
+
+def make_injector():
+    return CodeInjector(MagicMock(), MagicMock(), MagicMock())
+
+
+def test_backup_copies_contents_and_mtime(tmp_path, monkeypatch):
+    target = tmp_path / "target.py"
+    target.write_bytes(b"print('hello')\n")
+    os.utime(target, ns=(1_000_000_000, 2_000_000_000))
+    freeze_at(monkeypatch, datetime.datetime(2020, 12, 25, 17, 5, 55))
+
+    backup_path = make_injector()._create_backup(str(target))
+
+    assert backup_path == f"{target}.20201225170555.bak"
+    assert open(backup_path, "rb").read() == b"print('hello')\n"
+    assert os.stat(backup_path).st_mtime_ns == 2_000_000_000
+
+
+def test_unchanged_file_is_hard_linked_to_latest_backup(tmp_path, monkeypatch):
+    target = tmp_path / "target.py"
+    target.write_bytes(b"x = 1\n")
+    code_injector = make_injector()
+    freeze_at(monkeypatch, datetime.datetime(2020, 12, 25, 17, 5, 55))
+    first = code_injector._create_backup(str(target))
+    freeze_at(monkeypatch, datetime.datetime(2020, 12, 25, 17, 6, 0))
+    second = code_injector._create_backup(str(target))
+
+    assert first != second
+    assert os.path.samefile(first, second)
+
+
+def test_new_backup_does_not_truncate_linked_backup(tmp_path, monkeypatch):
+    target = tmp_path / "target.py"
+    target.write_bytes(b"x = 1\n")
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    code_injector = make_injector()
+    freeze_at(monkeypatch, datetime.datetime(2020, 12, 25, 17, 5, 55))
+    older = code_injector._create_backup(str(target))
+    freeze_at(monkeypatch, datetime.datetime(2020, 12, 25, 17, 6, 0))
+    linked = code_injector._create_backup(str(target))
+
+    # The file changes within the same second as the linked backup
+    target.write_bytes(b"x = 2\n")
+    os.utime(target, ns=(3_000_000_000, 3_000_000_000))
+    newer = code_injector._create_backup(str(target))
+
+    assert newer == linked
+    assert open(older, "rb").read() == b"x = 1\n"
+    assert open(newer, "rb").read() == b"x = 2\n"
+    assert not os.path.samefile(older, newer)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
@@ -0,0 +1,190 @@
+import importlib.util
+import io
+import os
+import pathlib
+import tarfile
+import zipfile
+
+import pytest
+
+pytest.importorskip("magic")
+pytest.importorskip("chardet")
+
+EXPLORER_PATH = pathlib.Path(__file__).parent.parent / "sys" / "explorer.py"
+
+
+def load_explorer():
+    # sys/ is not an importable package (it would shadow the standard library)
+    spec = importlib.util.spec_from_file_location("explorer", EXPLORER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def explorer(tmp_path):
+    explorer = load_explorer().Explorer()
+    explorer.current_directory = tmp_path
+    return explorer
+
+
+def test_ascii_head_with_utf8_tail_reads_as_utf8(explorer, tmp_path):
+    text = "a" * (1 << 17) + "\ncafé\n"
+    path = tmp_path / "notes.txt"
+    path.write_bytes(text.encode("utf-8"))
+
+    assert explorer.detect_encoding(path) == "utf-8"
+    assert explorer.read_file_content(path) == text
+
+
+def test_byte_order_mark_decides_encoding(explorer, tmp_path):
+    path = tmp_path / "bom.txt"
+    path.write_bytes("héllo".encode("utf-16"))
+
+    assert explorer.detect_encoding(path) == "utf-16"
+    assert explorer.read_file_content(path) == "héllo"
+
+
+def test_non_utf8_file_falls_back_to_detection(explorer, tmp_path):
+    text = "a" * (1 << 17) + "\n" + "café naïve résumé\n" * 200
+    path = tmp_path / "legacy.txt"
+    path.write_bytes(text.encode("cp1252"))
+
+    content = explorer.read_file_content(path)
+
+    assert not content.startswith("Error")
+    assert content.startswith("a" * 100)
+
+
+def test_read_file_content_limits_lines(explorer, tmp_path):
+    path = tmp_path / "lines.txt"
+    path.write_text("one\ntwo\nthree\n", encoding="utf-8")
+
+    assert explorer.read_file_content(path, num_lines=2) == "one\ntwo\n"
+
+
+def test_filter_files_by_type_agrees_with_the_statistics(explorer, tmp_path):
+    (tmp_path / "empty.txt").write_bytes(b"")
+    (tmp_path / "__init__.py").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("some notes\n")
+
+    statistics = explorer.get_file_type_statistics(workers=1)
+
+    for file_type, count in statistics.items():
+        assert len(explorer.filter_files_by_type(file_type)) == count
+    families = {file_type.partition("/")[0] for file_type in statistics}
+    assert sum(len(explorer.filter_files_by_type(family)) for family in families) == 3
+
+
+def test_extract_zip_serially_and_in_parallel(explorer, tmp_path):
+    archive = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("top.txt", "top")
+        zip_file.writestr("nested/deep/file.bin", b"\0\1" * 5000)
+        zip_file.writestr("folder/", "")
+
+    for workers in (1, 4):
+        destination = tmp_path / f"out{workers}"
+        explorer.extract_archive("bundle.zip", str(destination), workers=workers)
+
+        assert (destination / "top.txt").read_text() == "top"
+        assert (destination / "nested" / "deep" / "file.bin").read_bytes() == b"\0\1" * 5000
+        assert (destination / "folder").is_dir()
+
+
+def test_extract_zip_keeps_members_inside_destination(explorer, tmp_path):
+    archive = tmp_path / "evil.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("../escaped.txt", "no")
+        zip_file.writestr("/absolute.txt", "no")
+
+    destination = tmp_path / "out"
+    explorer.extract_archive("evil.zip", str(destination), workers=1)
+
+    assert not (tmp_path / "escaped.txt").exists()
+    assert (destination / "escaped.txt").read_text() == "no"
+    assert (destination / "absolute.txt").read_text() == "no"
+
+
+@pytest.mark.parametrize("mode", ["w", "w:gz"])
+def test_extract_tar_archives(explorer, tmp_path, mode):
+    source = tmp_path / "src"
+    (source / "sub").mkdir(parents=True)
+    (source / "sub" / "a.txt").write_text("alpha")
+    archive = tmp_path / "bundle.tar"
+    with tarfile.open(archive, mode) as tar:
+        tar.add(source / "sub", arcname="sub")
+
+    destination = tmp_path / "out"
+    explorer.extract_archive("bundle.tar", str(destination))
+
+    assert (destination / "sub" / "a.txt").read_text() == "alpha"
+
+
+def add_tar_member(tar, name, kind=tarfile.REGTYPE, linkname="", data=b"no"):
+    info = tarfile.TarInfo(name)
+    info.type = kind
+    info.linkname = linkname
+    info.size = len(data) if kind == tarfile.REGTYPE else 0
+    tar.addfile(info, io.BytesIO(data) if kind == tarfile.REGTYPE else None)
+
+
+@pytest.mark.parametrize("data_filter", [True, False])
+@pytest.mark.parametrize("member", [
+    ("../escaped.txt", tarfile.REGTYPE, ""),
+    ("link", tarfile.SYMTYPE, "../escaped.txt"),
+    ("link", tarfile.SYMTYPE, "/etc/passwd"),
+    ("link", tarfile.LNKTYPE, "../escaped.txt"),
+    ("device", tarfile.CHRTYPE, ""),
+])
+def test_extract_tar_refuses_members_outside_destination(explorer, tmp_path, monkeypatch, data_filter, member):
+    if not data_filter:
+        # Pythons without the security backports take the hand-written checks
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    elif not hasattr(tarfile, "data_filter"):
+        pytest.skip("tarfile has no data filter")
+    with tarfile.open(tmp_path / "evil.tar", "w") as tar:
+        add_tar_member(tar, *member)
+
+    with pytest.raises(tarfile.TarError):
+        explorer.extract_archive("evil.tar", str(tmp_path / "out"))
+
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_extract_tar_without_data_filter_keeps_safe_members(explorer, tmp_path, monkeypatch):
+    monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    with tarfile.open(tmp_path / "bundle.tar", "w") as tar:
+        add_tar_member(tar, "/absolute.txt", data=b"abs")
+        add_tar_member(tar, "sub/a.txt", data=b"alpha")
+        add_tar_member(tar, "sub/link", tarfile.SYMTYPE, "a.txt")
+        add_tar_member(tar, "hard", tarfile.LNKTYPE, "sub/a.txt")
+
+    destination = tmp_path / "out"
+    explorer.extract_archive("bundle.tar", str(destination))
+
+    assert (destination / "absolute.txt").read_bytes() == b"abs"
+    assert (destination / "sub" / "link").read_bytes() == b"alpha"
+    assert (destination / "hard").read_bytes() == b"alpha"
+
+
+def test_compare_many_matches_compare_files(explorer, tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"same content")
+    (tmp_path / "b.txt").write_bytes(b"same content")
+    (tmp_path / "c.txt").write_bytes(b"same c0ntent")
+    (tmp_path / "d.txt").write_bytes(b"shorter")
+    pairs = [("a.txt", "b.txt"), ("a.txt", "c.txt"), ("a.txt", "d.txt"), ("b.txt", "b.txt")]
+
+    assert explorer.compare_many(pairs) == [True, False, False, True]
+    assert explorer.compare_many(pairs) == [explorer.compare_files(*pair) for pair in pairs]
+
+
+def test_compare_many_sees_files_change_between_calls(explorer, tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"one")
+    (tmp_path / "b.txt").write_bytes(b"one")
+    assert explorer.compare_many([("a.txt", "b.txt")]) == [True]
+
+    (tmp_path / "b.txt").write_bytes(b"two")
+    os.utime(tmp_path / "b.txt", ns=(1, 1))
+
+    assert explorer.compare_many([("a.txt", "b.txt")]) == [False]
@@ -0,0 +1,168 @@
+import importlib.util
+import pathlib
+import sys
+
+import pytest
+
+pytest.importorskip("psutil")
+
+INJECTOR1_PATH = pathlib.Path(__file__).parent.parent / "sys" / "injector" / "injector1.py"
+
+
+def load_injector1():
+    # sys/ is not an importable package (it would shadow the standard library)
+    spec = importlib.util.spec_from_file_location("injector1", INJECTOR1_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def injector1():
+    return load_injector1()
+
+
+@pytest.fixture(autouse=True)
+def user_cache(tmp_path_factory, monkeypatch):
+    cache = tmp_path_factory.mktemp("user-cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    return cache
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / "sample.py"
+    path.write_bytes(b"x = 1\n")
+    return str(path)
+
+
+def counting_batch(calls):
+    def run_batch(paths):
+        calls.append(list(paths))
+        return {path: [{"code": "E1"}] for path in paths}
+
+    return run_batch
+
+
+def test_analysis_cache_reuses_results_for_unchanged_files(injector1, tmp_path, sample):
+    cache = injector1.AnalysisCache(str(tmp_path / "cache"))
+    calls = []
+
+    first = cache.run("flake8", [sample], counting_batch(calls))
+    second = cache.run("flake8", [sample], counting_batch(calls))
+
+    assert first == second == {sample: [{"code": "E1"}]}
+    assert calls == [[sample]]
+
+
+def test_analysis_cache_misses_when_the_file_changes(injector1, tmp_path, sample):
+    cache = injector1.AnalysisCache(str(tmp_path / "cache"))
+    calls = []
+    cache.run("flake8", [sample], counting_batch(calls))
+
+    pathlib.Path(sample).write_bytes(b"x = 2\n")
+    cache.run("flake8", [sample], counting_batch(calls))
+
+    assert len(calls) == 2
+
+
+def test_analysis_cache_misses_when_options_change(injector1, tmp_path, sample):
+    cache = injector1.AnalysisCache(str(tmp_path / "cache"))
+    calls = []
+    cache.run("pylint", [sample], counting_batch(calls), ["--disable=C"])
+    cache.run("pylint", [sample], counting_batch(calls), ["--disable=C"])
+    cache.run("pylint", [sample], counting_batch(calls), ["--disable=W"])
+
+    assert len(calls) == 2
+
+
+def test_analysis_cache_misses_when_a_config_file_changes(injector1, tmp_path, sample):
+    cache = injector1.AnalysisCache(str(tmp_path / "cache"))
+    config = tmp_path / "setup.cfg"
+    calls = []
+    cache.run("flake8", [sample], counting_batch(calls), (), [str(config)])
+
+    config.write_text("[flake8]\nmax-line-length = 120\n")
+    cache.run("flake8", [sample], counting_batch(calls), (), [str(config)])
+    cache.run("flake8", [sample], counting_batch(calls), (), [str(config)])
+
+    assert len(calls) == 2
+
+
+def test_tool_options_cover_the_bandit_profile(injector1, tmp_path):
+    fixer = injector1.AutoCodeFixer(str(tmp_path))
+    assert "-c" not in fixer._tool_options("bandit")[0]
+
+    (tmp_path / "bandit.yaml").write_text("skips: [B101]\n")
+    args, config_files = fixer._tool_options("bandit")
+
+    assert args[-2:] == ["-c", str(tmp_path / "bandit.yaml")]
+    assert config_files == [str(tmp_path / "bandit.yaml")]
+
+
+def test_pylint_skips_whole_program_checks(injector1, tmp_path):
+    args, _ = injector1.AutoCodeFixer(str(tmp_path))._tool_options("pylint")
+
+    assert "--disable=duplicate-code,cyclic-import" in args
+
+
+def test_pytest_batch_reports_the_status_of_each_file(injector1, tmp_path):
+    files = {
+        "test_ok.py": "def test_ok():\n    assert True\n",
+        "test_bad.py": "def test_ok():\n    pass\n\ndef test_bad():\n    assert False\n",
+        "test_skip.py": "import pytest\n\n@pytest.mark.skip(reason='later')\ndef test_skip():\n    pass\n",
+        "helpers.py": "VALUE = 1\n",
+        "broken.py": "import no_such_module_for_tests\n",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(content)
+
+    results = injector1.AutoCodeFixer(str(tmp_path))._run_pytest_batch(
+        [str(tmp_path / name) for name in files])
+
+    assert results == {
+        str(tmp_path / "test_ok.py"): 0,
+        str(tmp_path / "test_bad.py"): 1,
+        str(tmp_path / "test_skip.py"): 0,
+        # pytest.main([file_path]) found no tests here, or could not import it
+        str(tmp_path / "helpers.py"): 5,
+        str(tmp_path / "broken.py"): 2,
+    }
+
+
+def run_fixer(injector1, target, **options):
+    # complexity, dependency and duplication analysis need radon, safety and clonedigger
+    fixer = injector1.AutoCodeFixer(str(target))
+    fixer.fix_code_errors(complexity_analysis=False, dependency_analysis=False,
+                          code_duplication_detection=False, code_evolution_patterns=False, **options)
+    return fixer
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_fix_code_errors_reports_each_file(tmp_path, workers, capsys, monkeypatch):
+    # Pool workers import the module by name to unpickle their task
+    monkeypatch.syspath_prepend(str(INJECTOR1_PATH.parent))
+    injector1 = load_injector1()
+    monkeypatch.setitem(sys.modules, "injector1", injector1)
+    pytest.importorskip("bandit")
+    pytest.importorskip("flake8")
+    pytest.importorskip("pylint")
+    (tmp_path / "documented.py").write_text('"""Module."""\n\nVALUE = 1\n')
+    (tmp_path / "bare.py").write_text("import subprocess\nsubprocess.call('ls',shell=True)\n")
+    (tmp_path / "test_failing.py").write_text('"""Tests."""\n\n\ndef test_fails():\n    """Fails."""\n    assert False\n')
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "installed.py").write_text("x=1\n")
+
+    fixer = run_fixer(injector1, tmp_path, workers=workers)
+
+    bare, failing = str(tmp_path / "bare.py"), str(tmp_path / "test_failing.py")
+    categories = fixer.error_categories
+    # bandit flags the shell call, and the assert in the test file
+    assert sorted(categories["SecurityAnalysis"]) == [bare, failing]
+    assert categories["DocumentationGeneration"] == [bare]
+    # Files with no tests get pytest's status 5, just like a failing one
+    assert sorted(categories["TestingIntegration"]) == sorted([bare, str(tmp_path / "documented.py"), failing])
+    assert bare in categories["CodeStyleConsistency"]
+    assert "Summary of Fixed Errors:" in capsys.readouterr().out
+    assert (tmp_path / "bare.py.bak").read_bytes() == (tmp_path / "bare.py").read_bytes()
+    assert not (tmp_path / ".venv" / "installed.py.bak").exists()
@@ -0,0 +1,299 @@
+import ast
+import hashlib
+import json
+import importlib.util
+import os
+import pathlib
+import pickle
+import threading
+
+import pytest
+
+pytest.importorskip("psutil")
+
+INJECTOR2_PATH = pathlib.Path(__file__).parent.parent / "sys" / "injector" / "injector2.py"
+
+SAMPLE = b"""\
+import json
+import readline
+import os, sys
+from typing import List, Dict
+from .registry import plugins
+import third_party_plugin
+
+__all__ = ["List"]
+
+
+def main():
+    print(sys.argv)
+"""
+
+
+def load_injector2():
+    # sys/ is not an importable package (it would shadow the standard library)
+    spec = importlib.util.spec_from_file_location("injector2", INJECTOR2_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def injector2():
+    return load_injector2()
+
+
+@pytest.fixture(autouse=True)
+def user_cache(tmp_path_factory, monkeypatch):
+    cache = tmp_path_factory.mktemp("user-cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    return cache
+
+
+def run_fixer(injector2, target, **options):
+    fixer = injector2.AutoCodeFixer(str(target))
+    fixer.fix_code_errors(security_analysis=False, workers=1, **options)
+    return fixer
+
+
+def test_unused_imports_are_only_reported_by_default(injector2, tmp_path, capsys):
+    module = tmp_path / "sample.py"
+    module.write_bytes(SAMPLE)
+
+    fixer = run_fixer(injector2, tmp_path)
+
+    assert module.read_bytes() == SAMPLE
+    assert fixer.error_categories["UnusedImport"] == [str(module)]
+    assert "Unused imports detected" in capsys.readouterr().out
+
+
+def test_opt_in_removal_deletes_only_standard_library_imports(injector2, tmp_path):
+    module = tmp_path / "sample.py"
+    module.write_bytes(SAMPLE)
+
+    run_fixer(injector2, tmp_path, remove_unused_imports=True)
+
+    fixed = module.read_bytes()
+    if not injector2._REMOVABLE_MODULES:
+        # No standard library module list before Python 3.10, so nothing is deleted
+        assert fixed == SAMPLE
+        return
+    assert b"import json\n" not in fixed
+    assert b"import sys\n" in fixed
+    assert b"from typing import List\n" in fixed
+    # Side-effect, relative and third-party imports survive
+    assert b"import readline\n" in fixed
+    assert b"from .registry import plugins\n" in fixed
+    assert b"import third_party_plugin\n" in fixed
+    # The backup keeps the original
+    assert (tmp_path / "sample.py.bak").read_bytes() == SAMPLE
+
+
+def test_dry_run_never_rewrites(injector2, tmp_path):
+    module = tmp_path / "sample.py"
+    module.write_bytes(SAMPLE)
+
+    run_fixer(injector2, tmp_path, remove_unused_imports=True, dry_run=True)
+
+    assert module.read_bytes() == SAMPLE
+
+
+def test_remove_unused_imports_keeps_surrounding_lines(injector2):
+    source = b"import os, json  # tools\n\nx = os.sep\ny = 1; import re\n"
+    tree = ast.parse(source)
+    analysis = injector2._FusedAnalyzer()
+    analysis.visit(tree)
+
+    fixed = injector2.AutoCodeFixer._remove_unused_imports(None, source, analysis.unused_imports())
+
+    # A statement sharing its line with other code is left alone
+    assert fixed == b"import os  # tools\n\nx = os.sep\ny = 1; import re\n"
+
+
+def test_parse_cache_reuses_stored_trees(injector2, tmp_path):
+    cache = injector2.ParseCache(str(tmp_path / "cache"))
+    source = b"def f():\n    return 1\n"
+
+    first = cache.get("a.py", source)
+    entries = list((tmp_path / "cache").rglob("*.pkl"))
+    second = cache.get("a.py", source)
+
+    assert len(entries) == 1
+    assert ast.dump(first) == ast.dump(second) == ast.dump(ast.parse(source))
+    assert second is not first
+
+
+def test_parse_cache_misses_on_changed_or_corrupt_entries(injector2, tmp_path):
+    cache = injector2.ParseCache(str(tmp_path / "cache"))
+    cache.get("a.py", b"x = 1\n")
+
+    assert ast.dump(cache.get("a.py", b"x = 2\n")) == ast.dump(ast.parse(b"x = 2\n"))
+    assert len(list((tmp_path / "cache").rglob("*.pkl"))) == 2
+
+    for entry in (tmp_path / "cache").rglob("*.pkl"):
+        entry.write_bytes(b"not a pickle")
+    assert ast.dump(cache.get("a.py", b"x = 1\n")) == ast.dump(ast.parse(b"x = 1\n"))
+
+
+def test_parse_cache_ignores_entries_that_are_not_modules(injector2, tmp_path):
+    cache = injector2.ParseCache(str(tmp_path / "cache"))
+    cache.get("a.py", b"x = 1\n")
+    for entry in (tmp_path / "cache").rglob("*.pkl"):
+        entry.write_bytes(pickle.dumps(None))
+
+    assert ast.dump(cache.get("a.py", b"x = 1\n")) == ast.dump(ast.parse(b"x = 1\n"))
+
+
+def test_fixer_keeps_its_caches_out_of_the_target(injector2, tmp_path, user_cache):
+    target = tmp_path / "project"
+    target.mkdir()
+    (target / "sample.py").write_bytes(b"x = 1\n")
+
+    run_fixer(injector2, target)
+
+    [cache] = (user_cache / "instabuildhub" / "injector").iterdir()
+    assert cache.name.startswith("project-")
+    assert (cache / "parse-cache").is_dir()
+    assert (cache / "file-state.json").is_file()
+    assert sorted(path.name for path in target.iterdir()) == ["sample.py", "sample.py.bak"]
+
+
+def test_planted_cache_entries_in_the_target_are_never_loaded(injector2, tmp_path, monkeypatch):
+    (tmp_path / "sample.py").write_bytes(b"x = 1\n")
+    # Stored where, and under the key, the tree would be looked up if the caches lived in the target
+    key = hashlib.sha256(b"x = 1\n" + injector2.ParseCache("")._key_suffix).hexdigest()
+    planted = tmp_path / injector2.METADATA_DIRECTORY / "parse-cache" / key[:2]
+    planted.mkdir(parents=True)
+    (planted / (key[2:] + ".pkl")).write_bytes(pickle.dumps(None))
+    loaded = []
+    monkeypatch.setattr(injector2.pickle, "load", lambda file: loaded.append(file.name))
+
+    run_fixer(injector2, tmp_path)
+
+    assert not [name for name in loaded if name.startswith(str(tmp_path))]
+
+
+def test_python_files_skip_vcs_virtualenv_and_cache_folders(injector2, tmp_path):
+    for folder in ["pkg", ".git", "venv/lib", ".venv", "node_modules/x", injector2.METADATA_DIRECTORY]:
+        (tmp_path / folder).mkdir(parents=True)
+        (tmp_path / folder / "mod.py").write_bytes(b"x = 1\n")
+    (tmp_path / "top.py").write_bytes(b"x = 1\n")
+
+    files = injector2.AutoCodeFixer(str(tmp_path))._iter_python_files()
+
+    assert sorted(files) == [str(tmp_path / "pkg" / "mod.py"), str(tmp_path / "top.py")]
+
+
+class UnpicklableError(Exception):
+    def __init__(self, path, handle):
+        super().__init__(f"cannot fix {path}")
+        self.handle = handle
+
+
+def test_worker_reports_errors_as_picklable_text(injector2, tmp_path, monkeypatch):
+    def fail(self, file_path, **options):
+        raise UnpicklableError(file_path, threading.Lock())
+
+    monkeypatch.setattr(injector2.AutoCodeFixer, "_fix_file_errors", fail)
+
+    result = injector2._fix_file_worker(str(tmp_path), {}, "a.py")
+
+    assert pickle.loads(pickle.dumps(result)) == ("a.py", (), "UnpicklableError: cannot fix a.py")
+
+
+def test_chunk_paths_bounds_each_command_line(injector2):
+    paths = [f"/src/module_{index:04d}.py" for index in range(1000)]
+
+    chunks = list(injector2._chunk_paths(paths, limit=1000))
+
+    assert [path for chunk in chunks for path in chunk] == paths
+    assert all(sum(len(path) + 1 for path in chunk) <= 1000 for chunk in chunks)
+    assert len(chunks) > 1
+
+
+def test_run_tool_raises_tool_error_with_stderr_on_crash(injector2):
+    with pytest.raises(injector2.ToolError, match="no_such_linter"):
+        injector2._run_tool("no_such_linter", [], json.loads)
+
+
+def test_analysis_cache_skips_failed_chunks_without_caching_them(injector2, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(injector2._chunk_paths, "__defaults__", (1,))
+    paths = []
+    for name in ["a.py", "b.py"]:
+        (tmp_path / name).write_bytes(f"# {name}\n".encode())
+        paths.append(str(tmp_path / name))
+    cache = injector2.AnalysisCache(str(tmp_path / "cache"))
+
+    def run_batch(chunk):
+        if chunk == [paths[0]]:
+            raise injector2.ToolError("bandit exited with status 2: boom")
+        return {path: [{"issue": "x"}] for path in chunk}
+
+    assert cache.run("bandit", paths, run_batch) == {paths[1]: [{"issue": "x"}]}
+    assert "Error while running bandit" in capsys.readouterr().out
+
+    # Only the chunk that succeeded was cached
+    calls = []
+    cache.run("bandit", paths, lambda chunk: calls.append(chunk) or {})
+    assert calls == [[paths[0]]]
+
+
+def test_unchanged_files_are_not_analyzed_again(injector2, tmp_path, monkeypatch):
+    module = tmp_path / "sample.py"
+    module.write_bytes(SAMPLE)
+    first = run_fixer(injector2, tmp_path)
+
+    analyzed = []
+    original = injector2.AutoCodeFixer._fix_file_errors
+
+    def tracking(self, file_path, **options):
+        analyzed.append(file_path)
+        return original(self, file_path, **options)
+
+    monkeypatch.setattr(injector2.AutoCodeFixer, "_fix_file_errors", tracking)
+    second = run_fixer(injector2, tmp_path)
+
+    assert analyzed == []
+    # The recorded categories are reported as before
+    assert second.error_categories == first.error_categories
+
+
+def test_changed_content_or_options_are_analyzed_again(injector2, tmp_path, monkeypatch):
+    module = tmp_path / "sample.py"
+    module.write_bytes(SAMPLE)
+    run_fixer(injector2, tmp_path)
+
+    analyzed = []
+    original = injector2.AutoCodeFixer._fix_file_errors
+
+    def tracking(self, file_path, **options):
+        analyzed.append(file_path)
+        return original(self, file_path, **options)
+
+    monkeypatch.setattr(injector2.AutoCodeFixer, "_fix_file_errors", tracking)
+    # A new mtime alone only costs a hash, which still matches the record
+    os.utime(module, ns=(1_000_000_000, 1_000_000_000))
+    run_fixer(injector2, tmp_path)
+    assert analyzed == []
+
+    module.write_bytes(SAMPLE.replace(b"json", b"glob"))
+    run_fixer(injector2, tmp_path)
+    run_fixer(injector2, tmp_path, fix_code_comments=False)
+
+    assert analyzed == [str(module), str(module)]
+
+
+def test_backup_is_a_hard_link_until_the_file_is_fixed(injector2, tmp_path):
+    module = tmp_path / "sample.py"
+    module.write_bytes(SAMPLE)
+    backup = tmp_path / "sample.py.bak"
+
+    run_fixer(injector2, tmp_path, dry_run=True)
+    assert os.path.samefile(module, backup)
+
+    run_fixer(injector2, tmp_path, remove_unused_imports=True, fix_code_comments=False)
+
+    assert backup.read_bytes() == SAMPLE
+    if injector2._REMOVABLE_MODULES:
+        assert not os.path.samefile(module, backup)
+        assert module.read_bytes() != SAMPLE
+    assert not [path for path in tmp_path.iterdir() if path.name.endswith(".tmp")]
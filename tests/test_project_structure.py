@@ -0,0 +1,107 @@
+import io
+import json
+
+import pytest
+
+pytest.importorskip("hurry.filesize")
+pytest.importorskip("colorama")
+
+from Structure import structure
+from Structure.structure import ProjectStructure
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "module.py").write_text("x = 1\n")
+    (tmp_path / "readme.md").write_text("# readme\n")
+    project = ProjectStructure(str(tmp_path), max_workers=1)
+    project.read_project_structure()
+    return project
+
+
+def test_to_json_round_trips_the_structure(project):
+    assert json.loads(project.to_json()) == project.structure
+
+
+def test_to_json_without_orjson_gives_the_same_document(project, monkeypatch):
+    expected = json.loads(project.to_json())
+    monkeypatch.setattr(structure, "orjson", None)
+
+    data = project.to_json()
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == expected
+
+
+def test_to_json_writes_to_a_path(project, tmp_path):
+    output = tmp_path / "summary.json"
+
+    data = project.to_json(output)
+
+    assert output.read_bytes() == data
+    assert json.loads(data)["pkg"]["content"]["module.py"]["type"] == "file"
+
+
+@pytest.mark.parametrize("text_only", [False, True])
+def test_file_content_streams_to_stdout(project, tmp_path, monkeypatch, capfd, text_only):
+    text = "café " * 20000
+    (tmp_path / "pkg" / "module.py").write_text(text, encoding="utf-8")
+    if text_only:
+        # notebook and Colab streams have no binary buffer underneath
+        stream = io.StringIO()
+        monkeypatch.setattr(structure.sys, "stdout", stream)
+
+    project._stream_file_content(str(tmp_path / "pkg" / "module.py"), 1)
+
+    output = stream.getvalue() if text_only else capfd.readouterr().out
+    assert "Error reading content" not in output
+    assert output.endswith(text + "\n")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    files = {
+        "top.txt": 10,
+        "pkg/a.py": 100,
+        "pkg/sub/b.py": 1000,
+        "pkg/sub/deeper/c.py": 5000,
+        "node_modules/dep/index.js": 70000,
+        "pkg/build-1/out.bin": 80000,
+    }
+    for name, length in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * length)
+    return tmp_path
+
+
+def read_structure(path, **options):
+    project = ProjectStructure(str(path), **options)
+    project.read_project_structure()
+    return project
+
+
+def test_serial_and_parallel_scans_agree(tree):
+    serial = read_structure(tree, max_workers=1, exclude_dirs=())
+    parallel = read_structure(tree, max_workers=4, exclude_dirs=())
+
+    assert parallel.structure == serial.structure
+    assert parallel.total_size == serial.total_size == 156110
+    sub = serial.structure["pkg"]["content"]["sub"]
+    assert sub["size"] == structure._fmt_size(6000)
+    assert serial.structure["pkg"]["size"] == structure._fmt_size(86100)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_excluded_dirs_are_skipped(tree, max_workers):
+    project = read_structure(tree, max_workers=max_workers, exclude_dirs=["node_modules", "build-*"])
+    default = read_structure(tree, max_workers=max_workers)
+
+    assert "node_modules" not in project.structure
+    assert "build-1" not in project.structure["pkg"]["content"]
+    assert project.total_size == 6110
+    assert project.structure["pkg"]["size"] == structure._fmt_size(6100)
+    # node_modules is left out by default
+    assert "node_modules" not in default.structure
+    assert default.total_size == 86110